@@ -1,6 +1,15 @@
 """External API clients for twitter and openai."""
 
+from .cassette import Cassette, CassetteError, ReplayedError
+from .feeds import FeedClient
 from .openai import OpenAIClient
 from .twitter import TwitterClient
 
-__all__ = ["TwitterClient", "OpenAIClient"]
\ No newline at end of file
+__all__ = [
+    "Cassette",
+    "CassetteError",
+    "FeedClient",
+    "ReplayedError",
+    "TwitterClient",
+    "OpenAIClient",
+]
\ No newline at end of file
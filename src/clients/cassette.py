@@ -0,0 +1,288 @@
+"""Record and replay of external API traffic."""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteError(RuntimeError):
+    """Raised when a cassette cannot serve or store an interaction."""
+
+
+class ReplayedError(Exception):
+    """Error recorded from a live service and raised again during replay."""
+
+    def __init__(self, error_type: str, message: str):
+        super().__init__(f"{error_type}: {message}")
+        self.error_type = error_type
+
+
+class Cassette:
+    """Stores request/response pairs with their timings in a JSON lines file.
+
+    In record mode every call goes to the live service and the interaction is
+    appended to the file. An existing cassette is never truncated, so a
+    restarted recording session extends the previous one. In replay mode
+    calls never leave the process: each is answered with the first unused
+    interaction recorded for the same request, falling back to the next
+    unused one on the same channel, so requests with volatile content such
+    as timestamps still replay in order.
+    """
+
+    MODES = ("record", "replay")
+
+    def __init__(self, path: str, mode: str, latency_scale: float = 1.0):
+        if mode not in self.MODES:
+            raise ValueError(f"Invalid cassette mode: {mode!r}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, List[dict]] = {}
+        self._file = None
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists() and self.path.stat().st_size:
+                logger.info("Appending to existing cassette %s", self.path)
+            self._file = self.path.open("a", encoding="utf-8")
+        else:
+            self._load()
+
+    def _load(self) -> None:
+        """Load recorded interactions grouped by channel."""
+        if not self.path.exists():
+            raise CassetteError(f"Cassette not found: {self.path}")
+
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    interaction = json.loads(line)
+                    self._interactions.setdefault(interaction["channel"], []).append(interaction)
+
+        logger.info(
+            "Loaded %d interactions from cassette %s",
+            sum(len(items) for items in self._interactions.values()),
+            self.path
+        )
+
+    @property
+    def replaying(self) -> bool:
+        """Whether calls are served from the cassette instead of live."""
+        return self.mode == "replay"
+
+    def call(
+        self,
+        channel: str,
+        request: Dict[str, Any],
+        live: Callable[[], Any],
+        encode: Callable[[Any], Dict[str, Any]]
+    ) -> Any:
+        """Run a call through the cassette.
+
+        Args:
+            channel: Name of the API operation
+            request: JSON-serializable request parameters
+            live: Performs the call against the live service
+            encode: Converts a live response to a JSON-serializable dict
+
+        Returns:
+            The live response when recording, the encoded dict when replaying
+
+        Raises:
+            ReplayedError: If the replayed interaction recorded an error
+        """
+        if self.replaying:
+            return self._replay(channel, request)
+
+        start = time.perf_counter()
+        try:
+            response = live()
+        except Exception as e:
+            self._write(channel, request, None, time.perf_counter() - start, e)
+            raise
+
+        self._write(channel, request, encode(response), time.perf_counter() - start, None)
+        return response
+
+    def _write(
+        self,
+        channel: str,
+        request: Dict[str, Any],
+        response: Optional[Dict[str, Any]],
+        elapsed: float,
+        error: Optional[Exception]
+    ) -> None:
+        """Append an interaction to the cassette file."""
+        interaction = {
+            "channel": channel,
+            "key": _request_key(request),
+            "request": request,
+            "response": response,
+            "error": [type(error).__name__, str(error)] if error else None,
+            "elapsed": round(elapsed, 6),
+        }
+        line = json.dumps(interaction, ensure_ascii=False, separators=(",", ":"), default=str)
+
+        with self._lock:
+            if self._file is None:
+                raise CassetteError("Cassette is closed")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def _replay(self, channel: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Serve the matching recorded interaction."""
+        key = _request_key(request)
+
+        with self._lock:
+            candidates = self._interactions.get(channel, [])
+            index = next(
+                (i for i, item in enumerate(candidates) if item["key"] == key),
+                0 if candidates else None
+            )
+            if index is None:
+                raise CassetteError(f"No recorded interactions left for {channel}")
+            interaction = candidates.pop(index)
+
+        if self.latency_scale > 0:
+            time.sleep(interaction["elapsed"] * self.latency_scale)
+
+        if interaction["error"]:
+            raise ReplayedError(*interaction["error"])
+        return interaction["response"]
+
+    def sleep(self, seconds: float) -> None:
+        """Wait like the client would live, scaled by latency_scale when replaying.
+
+        Args:
+            seconds: Delay the live client would wait
+        """
+        if self.replaying:
+            seconds *= self.latency_scale
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def close(self) -> None:
+        """Close the cassette file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _request_key(request: Dict[str, Any]) -> str:
+    """Hash the canonical JSON form of a request."""
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _to_namespace(value: Any) -> Any:
+    """Convert nested dicts to attribute-access objects."""
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _to_namespace(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_to_namespace(v) for v in value]
+    return value
+
+
+def _encode_completion(response: Any) -> Dict[str, Any]:
+    """Keep the parts of a chat completion the bot reads."""
+    usage = getattr(response, "usage", None)
+    return {
+        "model": getattr(response, "model", None),
+        "choices": [
+            {"message": {"content": choice.message.content}}
+            for choice in response.choices
+        ],
+        "usage": {
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+            "total_tokens": usage.total_tokens,
+        } if usage else None,
+    }
+
+
+class _Completions:
+    """Stand-in for ``OpenAI().chat.completions``."""
+
+    def __init__(self, client: Any, cassette: Cassette):
+        self._client = client
+        self._cassette = cassette
+
+    def create(self, **kwargs: Any) -> Any:
+        response = self._cassette.call(
+            "openai.chat.completions.create",
+            kwargs,
+            lambda: self._client.chat.completions.create(**kwargs),
+            _encode_completion
+        )
+        return _to_namespace(response) if self._cassette.replaying else response
+
+
+class CassetteOpenAI:
+    """Routes the OpenAI calls used by ``OpenAIClient`` through a cassette."""
+
+    def __init__(self, client: Any, cassette: Cassette):
+        self.chat = SimpleNamespace(completions=_Completions(client, cassette))
+
+
+class CassetteTwitterClient:
+    """Routes the tweepy ``Client`` calls used by ``TwitterClient`` through a cassette."""
+
+    def __init__(self, client: Any, cassette: Cassette):
+        self._client = client
+        self._cassette = cassette
+
+    def create_tweet(self, **kwargs: Any) -> Any:
+        response = self._cassette.call(
+            "twitter.create_tweet",
+            kwargs,
+            lambda: self._client.create_tweet(**kwargs),
+            lambda r: {"data": r.data}
+        )
+        return SimpleNamespace(**response) if self._cassette.replaying else response
+
+    def get_me(self, **kwargs: Any) -> Any:
+        response = self._cassette.call(
+            "twitter.get_me",
+            kwargs,
+            lambda: self._client.get_me(**kwargs),
+            lambda r: {"data": {"id": r.data["id"], "username": r.data["username"]}}
+        )
+        return SimpleNamespace(**response) if self._cassette.replaying else response
+
+    def get_users_tweets(self, id: Any, **kwargs: Any) -> Any:
+        response = self._cassette.call(
+            "twitter.get_users_tweets",
+            {"id": id, **kwargs},
+            lambda: self._client.get_users_tweets(id, **kwargs),
+            lambda r: {"data": [{"id": t["id"], "text": t["text"]} for t in r.data or []]}
+        )
+        return SimpleNamespace(**response) if self._cassette.replaying else response
+
+
+class CassetteTwitterAPI:
+    """Routes the tweepy ``API`` calls used by ``TwitterClient`` through a cassette."""
+
+    def __init__(self, api: Any, cassette: Cassette):
+        self._api = api
+        self._cassette = cassette
+
+    def verify_credentials(self) -> Any:
+        response = self._cassette.call(
+            "twitter.verify_credentials",
+            {},
+            self._api.verify_credentials,
+            lambda user: {"screen_name": user.screen_name} if user else None
+        )
+        if self._cassette.replaying:
+            return SimpleNamespace(**response) if response else None
+        return response
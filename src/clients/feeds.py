@@ -0,0 +1,211 @@
+"""RSS, Atom and JSON feed client."""
+
+import email.utils
+import hashlib
+import html
+import json
+import logging
+import re
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import List, Optional
+
+import requests
+
+from src.models.types import ContextSnippet, FeedResult
+
+logger = logging.getLogger(__name__)
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+MAX_SNIPPET_LENGTH = 240
+CHUNK_SIZE = 64 * 1024
+
+
+class FeedClient:
+    """Fetches feeds with conditional requests.
+
+    Bodies are streamed and rejected once they exceed ``max_bytes``, so a
+    large or hostile feed cannot exhaust the memory of the process.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_items: int = 20,
+        max_bytes: int = 2 * 1024 * 1024
+    ):
+        self.timeout = timeout
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.session = requests.Session()
+
+    def fetch(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> FeedResult:
+        """Fetch a feed unless it is unchanged since the last fetch.
+
+        Args:
+            url: Feed URL
+            etag: ETag returned by the previous fetch
+            last_modified: Last-Modified returned by the previous fetch
+
+        Returns:
+            Fetch result with the parsed snippets and new validators
+
+        Raises:
+            requests.RequestException: If the request fails
+            ValueError: If the feed is too large or cannot be parsed
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+        try:
+            if response.status_code == 304:
+                return FeedResult(not_modified=True, etag=etag, last_modified=last_modified)
+            response.raise_for_status()
+            content = self._read_capped(response)
+        finally:
+            response.close()
+
+        return FeedResult(
+            not_modified=False,
+            snippets=parse_feed(url, content)[:self.max_items],
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified")
+        )
+
+    def _read_capped(self, response: requests.Response) -> bytes:
+        """Read a streamed body, refusing to buffer more than max_bytes."""
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit() and int(length) > self.max_bytes:
+            raise ValueError(f"Feed too large: {length} bytes exceeds {self.max_bytes}")
+
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            body += chunk
+            if len(body) > self.max_bytes:
+                raise ValueError(f"Feed too large: exceeds {self.max_bytes} bytes")
+        return bytes(body)
+
+
+def parse_feed(source: str, content: bytes) -> List[ContextSnippet]:
+    """Parse an RSS 2.0, Atom or JSON feed.
+
+    Args:
+        source: Feed URL the content came from
+        content: Raw feed body
+
+    Returns:
+        Snippets in feed order
+
+    Raises:
+        ValueError: If the content is not a recognized feed
+    """
+    fetched_at = time.time()
+    if content.lstrip()[:1] in (b"{", b"["):
+        snippets = _parse_json_feed(source, json.loads(content), fetched_at)
+        return [snippet for snippet in snippets if snippet.text]
+
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as e:
+        raise ValueError(f"Unrecognized feed format: {e}") from e
+
+    snippets = []
+    for item in root.iter("item"):
+        snippets.append(_snippet(
+            source,
+            item.findtext("guid") or item.findtext("link") or item.findtext("title"),
+            item.findtext("title"),
+            item.findtext("description"),
+            item.findtext("link"),
+            _parse_date(item.findtext("pubDate")),
+            fetched_at
+        ))
+    for entry in root.iter(f"{ATOM_NS}entry"):
+        link = entry.find(f"{ATOM_NS}link")
+        url = link.get("href", "") if link is not None else ""
+        snippets.append(_snippet(
+            source,
+            entry.findtext(f"{ATOM_NS}id") or url,
+            entry.findtext(f"{ATOM_NS}title"),
+            entry.findtext(f"{ATOM_NS}summary"),
+            url,
+            _parse_date(entry.findtext(f"{ATOM_NS}updated")),
+            fetched_at
+        ))
+    return [snippet for snippet in snippets if snippet.text]
+
+
+def _parse_json_feed(source: str, data: dict, fetched_at: float) -> List[ContextSnippet]:
+    """Parse a JSON Feed document."""
+    if not isinstance(data, dict) or not isinstance(data.get("items"), list):
+        raise ValueError("Unrecognized feed format: missing items")
+
+    return [
+        _snippet(
+            source,
+            str(item.get("id") or item.get("url") or item.get("title")),
+            item.get("title"),
+            item.get("summary") or item.get("content_text") or item.get("content_html"),
+            item.get("url", ""),
+            _parse_date(item.get("date_published")),
+            fetched_at
+        )
+        for item in data["items"]
+    ]
+
+
+def _snippet(
+    source: str,
+    item_id: Optional[str],
+    title: Optional[str],
+    summary: Optional[str],
+    url: Optional[str],
+    published: Optional[float],
+    fetched_at: float
+) -> ContextSnippet:
+    """Build a snippet from feed item fields."""
+    parts = [_clean(title), _clean(summary)]
+    text = " - ".join(part for part in parts if part)
+    if len(text) > MAX_SNIPPET_LENGTH:
+        text = text[:MAX_SNIPPET_LENGTH - 3] + "..."
+
+    digest = hashlib.sha1(f"{source}|{item_id or text}".encode("utf-8")).hexdigest()[:16]
+    return ContextSnippet(
+        id=digest,
+        source=source,
+        text=text,
+        url=url or "",
+        published=published,
+        fetched_at=fetched_at
+    )
+
+
+def _clean(value: Optional[str]) -> str:
+    """Strip markup and collapse whitespace."""
+    if not value:
+        return ""
+    return " ".join(html.unescape(re.sub(r"<[^>]+>", " ", value)).split())
+
+
+def _parse_date(value: Optional[str]) -> Optional[float]:
+    """Parse RFC 822 or ISO 8601 dates to a timestamp."""
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
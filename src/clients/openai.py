@@ -1,28 +1,59 @@
 """OpenAI API client wrapper."""
 
 import logging
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from openai import OpenAI
 
+from src.profiling import profile_stage
+
+from .cassette import Cassette, CassetteOpenAI
+
 logger = logging.getLogger(__name__)
 
+_shared_clients: Dict[str, OpenAI] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _shared_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for an API key.
+    
+    Personas using the same key share one client and its connection pool.
+    """
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            client = _shared_clients[api_key] = OpenAI(api_key=api_key)
+        return client
+
 
 class OpenAIClient:
     """Handles OpenAI API interactions."""
     
-    def __init__(self, api_key: str, model: str = "gpt-4-turbo"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4-turbo",
+        cassette: Optional[Cassette] = None,
+        usage_callback: Optional[Callable[[str, int, int], None]] = None
+    ):
         self.api_key = api_key
         self.model = model
-        self.client = OpenAI(api_key=api_key)
+        self.usage_callback = usage_callback
+        self.cassette = cassette
+        self.client = _shared_client(api_key)
+        if cassette:
+            self.client = CassetteOpenAI(self.client, cassette)
         
     def generate_completion(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.8,
         max_tokens: int = 100,
-        max_retries: int = 3
+        max_retries: int = 3,
+        model: Optional[str] = None
     ) -> Optional[str]:
         """Generate a completion using the OpenAI API.
         
@@ -31,34 +62,52 @@ class OpenAIClient:
             temperature: Sampling temperature (0.0 to 2.0)
             max_tokens: Maximum tokens in response
             max_retries: Maximum number of retry attempts
+            model: Model to use instead of the client default
             
         Returns:
             Generated text completion or None if failed
         """
+        model = model or self.model
         for attempt in range(max_retries):
             try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
+                with profile_stage("openai.request"):
+                    response = self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    )
                 
+                usage = getattr(response, "usage", None)
+                if usage and self.usage_callback:
+                    self.usage_callback(model, usage.prompt_tokens, usage.completion_tokens)
+                    
                 completion = response.choices[0].message.content.strip()
                 return completion
                 
             except Exception as e:
-                logger.error(f"OpenAI API error (attempt {attempt + 1}): {e}")
+                logger.error("OpenAI API error (attempt %d): %s", attempt + 1, e)
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    with profile_stage("openai.retry_wait"):
+                        if self.cassette:
+                            self.cassette.sleep(2 ** attempt)
+                        else:
+                            time.sleep(2 ** attempt)
                     
         return None
         
-    def generate_tweet(self, prompt: str) -> Optional[str]:
+    def generate_tweet(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 100
+    ) -> Optional[str]:
         """Generate a tweet based on a prompt.
         
         Args:
             prompt: The prompt to generate a tweet from
+            model: Model to use instead of the client default
+            max_tokens: Maximum tokens in the tweet
             
         Returns:
             Generated tweet text or None if failed
@@ -74,7 +123,7 @@ class OpenAIClient:
             }
         ]
         
-        tweet = self.generate_completion(messages)
+        tweet = self.generate_completion(messages, max_tokens=max_tokens, model=model)
         
         if tweet:
             tweet = tweet.strip('"\'')
@@ -1,31 +1,107 @@
 """Twitter API client wrapper."""
 
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Any, List, Optional
 
+import requests
 from tweepy import API, Client, OAuthHandler, TweepyException
 
+from src.models.types import ContextSnippet
+from src.profiling import profile_stage
+
+from .cassette import Cassette, CassetteTwitterAPI, CassetteTwitterClient
+
 logger = logging.getLogger(__name__)
 
 
+class _ProfiledSession(requests.Session):
+    """Session that times OAuth1 signing separately from the round-trip.
+    
+    Request preparation is where requests applies the OAuth1 auth handler,
+    so it is timed as the signing stage.
+    """
+    
+    def prepare_request(self, request: requests.Request) -> requests.PreparedRequest:
+        with profile_stage("twitter.sign"):
+            return super().prepare_request(request)
+            
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        with profile_stage("twitter.request"):
+            return super().send(request, **kwargs)
+
+
+class _ThreadLocalSession:
+    """Session proxy that hands each thread its own ``_ProfiledSession``.
+    
+    ``requests.Session`` is not documented as thread-safe, and a client posts
+    from the event loop while context ingestion fetches the timeline through
+    it from worker threads. Calls from the same thread reuse one session and
+    its connection pool.
+    """
+    
+    def __init__(self):
+        self._local = threading.local()
+        
+    @property
+    def session(self) -> _ProfiledSession:
+        """Session of the calling thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = _ProfiledSession()
+        return session
+        
+    def request(self, *args: Any, **kwargs: Any) -> requests.Response:
+        return self.session.request(*args, **kwargs)
+        
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+
+_shared_session: Optional[_ThreadLocalSession] = None
+
+
+def _get_shared_session() -> _ThreadLocalSession:
+    """Return the HTTP session shared by clients in compact mode.
+    
+    tweepy passes OAuth1 auth with each request, so accounts can share one
+    session and its connection pool, one per thread.
+    """
+    global _shared_session
+    
+    if _shared_session is None:
+        _shared_session = _ThreadLocalSession()
+    return _shared_session
+
+
 class TwitterClient:
-    """Handles Twitter API interactions."""
+    """Handles Twitter API interactions.
+    
+    In compact mode clients share one HTTP session and drop the v1.1 API
+    object once the username has been resolved.
+    """
     
     def __init__(
         self,
         api_key: str,
         api_secret: str,
         access_token: str,
-        access_token_secret: str
+        access_token_secret: str,
+        cassette: Optional[Cassette] = None,
+        compact: bool = False
     ):
         self.api_key = api_key
         self.api_secret = api_secret
         self.access_token = access_token
         self.access_token_secret = access_token_secret
+        self.cassette = cassette
+        self.compact = compact
         
         self._client: Optional[Client] = None
         self._api: Optional[API] = None
         self._username: Optional[str] = None
+        self._user_id: Optional[str] = None
         
     def connect(self) -> None:
         """Initialize Twitter API connections."""
@@ -40,22 +116,30 @@ class TwitterClient:
                 access_token_secret=self.access_token_secret,
                 wait_on_rate_limit=True
             )
+            self._client.session = _get_shared_session() if self.compact else _ThreadLocalSession()
             
             self._api = API(auth, wait_on_rate_limit=True)
             
+            if self.cassette:
+                self._client = CassetteTwitterClient(self._client, self.cassette)
+                self._api = CassetteTwitterAPI(self._api, self.cassette)
+            
             try:
                 user = self._api.verify_credentials()
                 if user:
                     self._username = user.screen_name
-                    logger.info(f"Successfully connected to Twitter API as @{self._username}")
+                    logger.info("Successfully connected to Twitter API as @%s", self._username)
                 else:
                     logger.info("Successfully connected to Twitter API")
             except Exception as e:
-                logger.warning(f"Could not retrieve username: {e}")
+                logger.warning("Could not retrieve username: %s", e)
                 logger.info("Successfully connected to Twitter API")
+                
+            if self.compact:
+                self._api = None
             
         except Exception as e:
-            logger.error(f"Failed to connect to Twitter API: {e}")
+            logger.error("Failed to connect to Twitter API: %s", e)
             raise
             
     def post_tweet(self, text: str) -> Optional[str]:
@@ -71,37 +155,76 @@ class TwitterClient:
             raise RuntimeError("Twitter client not connected")
             
         try:
-            response = self._client.create_tweet(text=text)
+            with profile_stage("twitter.post"):
+                response = self._client.create_tweet(text=text)
             
             if response.data:
                 tweet_id = response.data['id']
-                logger.info(f"Successfully posted tweet: {text[:50]}...")
+                logger.info("Successfully posted tweet: %.50s...", text)
                 
                 if self._username:
-                    logger.info(f"Tweet URL: https://twitter.com/{self._username}/status/{tweet_id}")
+                    logger.info("Tweet URL: https://twitter.com/%s/status/%s", self._username, tweet_id)
                 else:
-                    logger.info(f"Tweet posted with ID: {tweet_id}")
+                    logger.info("Tweet posted with ID: %s", tweet_id)
                     
                 return tweet_id
                 
         except TweepyException as e:
-            logger.error(f"Twitter API error: {e}")
+            logger.error("Twitter API error: %s", e)
         except Exception as e:
-            logger.error(f"Unexpected error posting tweet: {e}")
+            logger.error("Unexpected error posting tweet: %s", e)
             
         return None
         
+    def get_recent_tweets(
+        self,
+        since_id: Optional[str] = None,
+        max_results: int = 10
+    ) -> List[ContextSnippet]:
+        """Fetch the account's own tweets newer than since_id.
+        
+        Args:
+            since_id: Only return tweets newer than this ID
+            max_results: Maximum number of tweets (5 to 100)
+            
+        Returns:
+            Tweets as context snippets, newest first
+        """
+        if not self._client:
+            raise RuntimeError("Twitter client not connected")
+            
+        if not self._user_id:
+            self._user_id = str(self._client.get_me().data["id"])
+            
+        response = self._client.get_users_tweets(
+            self._user_id, since_id=since_id, max_results=max_results
+        )
+        fetched_at = time.time()
+        return [
+            ContextSnippet(
+                id=str(tweet["id"]),
+                source="twitter:timeline",
+                text=tweet["text"],
+                url=f"https://twitter.com/{self._username}/status/{tweet['id']}" if self._username else "",
+                fetched_at=fetched_at
+            )
+            for tweet in response.data or []
+        ]
+        
     def verify_credentials(self) -> bool:
         """Verify that the credentials are valid.
         
         Returns:
             True if credentials are valid, False otherwise
         """
-        if not self._api:
+        if not self._api and not self._client:
             return False
             
         try:
-            self._api.verify_credentials()
+            if self._api:
+                self._api.verify_credentials()
+            else:
+                self._client.get_me()
             return True
         except Exception:
             return False
\ No newline at end of file
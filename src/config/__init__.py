@@ -1,20 +1,20 @@
 """Configuration management for the twitter persona bot."""
 
-import logging
+import dataclasses
+import json
 import os
-from typing import List
+from typing import Dict, List, Tuple
 
 from dotenv import load_dotenv
 
 from src.models.types import Settings
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from .log import configure_logging, log_context, new_request_id, shutdown_logging
 
 load_dotenv()
 
+configure_logging()
+
 def load_settings() -> Settings:
     """Load settings from environment variables.
     
@@ -53,7 +53,103 @@ def load_settings() -> Settings:
         twitter_access_token=os.getenv("TWITTER_ACCESS_TOKEN"),
         twitter_access_token_secret=os.getenv("TWITTER_ACCESS_TOKEN_SECRET"),
         openai_api_key=os.getenv("OPENAI_API_KEY"),
-        openai_model=os.getenv("OPENAI_MODEL", "gpt-4-turbo")
+        openai_model=os.getenv("OPENAI_MODEL") or "gpt-4-turbo",
+        persona_id=os.getenv("PERSONA_ID", "default"),
+        cassette_mode=os.getenv("CASSETTE_MODE", ""),
+        cassette_path=os.getenv("CASSETTE_PATH", "cassettes/session.jsonl"),
+        cassette_latency_scale=float(os.getenv("CASSETTE_LATENCY_SCALE", "1.0")),
+        data_dir=os.getenv("DATA_DIR", "data"),
+        budget_usd=float(os.getenv("BUDGET_USD", "0")),
+        budget_window_hours=float(os.getenv("BUDGET_WINDOW_HOURS", "24")),
+        budget_fallback_model=os.getenv("BUDGET_FALLBACK_MODEL", "gpt-4o-mini"),
+        model_prices=_parse_prices(os.getenv("MODEL_PRICES", "")),
+        profile_enabled=os.getenv("PROFILE_ENABLED", "false").lower() in ("1", "true", "yes"),
+        profile_sample_every=int(os.getenv("PROFILE_SAMPLE_EVERY", "0")),
+        context_feeds=_split_list(os.getenv("CONTEXT_FEEDS", "")),
+        context_own_timeline=os.getenv("CONTEXT_OWN_TIMELINE", "false").lower() in ("1", "true", "yes"),
+        context_keywords=_split_list(os.getenv("CONTEXT_KEYWORDS", "")),
+        context_refresh_minutes=float(os.getenv("CONTEXT_REFRESH_MINUTES", "30")),
+        context_ttl_hours=float(os.getenv("CONTEXT_TTL_HOURS", "24")),
+        context_top_k=int(os.getenv("CONTEXT_TOP_K", "3")),
+        memory_budget_mb=int(os.getenv("MEMORY_BUDGET_MB", "0")),
+        memory_compact=os.getenv("MEMORY_COMPACT", "false").lower() in ("1", "true", "yes")
     )
 
-__all__ = ["load_settings"]
\ No newline at end of file
+
+def load_personas() -> List[Settings]:
+    """Load the settings of every persona to run in this process.
+    
+    Without ``PERSONAS`` this is the single persona configured by the other
+    environment variables. Otherwise ``PERSONAS`` holds a JSON list of
+    objects, each overriding ``Settings`` fields such as ``persona_id``,
+    ``system_prompt`` and the Twitter access tokens for one persona; fields
+    not overridden are shared. Each persona keeps its state in a
+    subdirectory of ``DATA_DIR`` named after its ``persona_id``.
+    
+    Returns:
+        Settings of each persona
+        
+    Raises:
+        ValueError: If required environment variables are missing or
+            ``PERSONAS`` is invalid
+    """
+    base = load_settings()
+    raw = os.getenv("PERSONAS")
+    if not raw:
+        return [base]
+        
+    try:
+        overrides = json.loads(raw)
+    except ValueError as e:
+        raise ValueError(f"Invalid PERSONAS JSON: {e}") from None
+    if not isinstance(overrides, list) or not all(isinstance(o, dict) for o in overrides):
+        raise ValueError("PERSONAS must be a JSON list of objects")
+        
+    personas = []
+    for index, override in enumerate(overrides):
+        if not override.get("persona_id"):
+            raise ValueError(f"PERSONAS entry {index} is missing persona_id")
+        override.setdefault("data_dir", os.path.join(base.data_dir, override["persona_id"]))
+        try:
+            personas.append(dataclasses.replace(base, **override))
+        except TypeError as e:
+            raise ValueError(f"Invalid PERSONAS entry {index}: {e}") from None
+            
+    persona_ids = [settings.persona_id for settings in personas]
+    if len(set(persona_ids)) != len(persona_ids):
+        raise ValueError("PERSONAS entries must have distinct persona_id values")
+    return personas
+
+
+def _split_list(value: str) -> List[str]:
+    """Split a comma-separated environment variable."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _parse_prices(value: str) -> Dict[str, Tuple[float, float]]:
+    """Parse ``model=prompt/completion`` prices in USD per million tokens.
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    prices = {}
+    for item in _split_list(value):
+        try:
+            model, price = item.split("=", 1)
+            prompt_price, completion_price = price.split("/", 1)
+            prices[model.strip()] = (float(prompt_price), float(completion_price))
+        except ValueError:
+            raise ValueError(
+                f"Invalid MODEL_PRICES entry {item!r}, expected model=prompt/completion"
+            ) from None
+    return prices
+
+
+__all__ = [
+    "configure_logging",
+    "load_personas",
+    "load_settings",
+    "log_context",
+    "new_request_id",
+    "shutdown_logging",
+]
\ No newline at end of file
@@ -0,0 +1,322 @@
+"""Logging setup for the twitter persona bot."""
+
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+persona_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "persona_id", default=None
+)
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "request_id", default=None
+)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handlers: List[logging.Handler] = []
+
+
+def new_request_id() -> str:
+    """Create a short random ID for correlating the records of one request."""
+    return uuid.uuid4().hex[:12]
+
+
+@contextmanager
+def log_context(
+    persona_id: Optional[str] = None,
+    request_id: Optional[str] = None
+) -> Iterator[None]:
+    """Attach persona and request IDs to every record logged in this context.
+
+    Args:
+        persona_id: Persona the records belong to, None keeps the current one
+        request_id: Request the records belong to, None keeps the current one
+    """
+    tokens = []
+    if persona_id is not None:
+        tokens.append((persona_id_var, persona_id_var.set(persona_id)))
+    if request_id is not None:
+        tokens.append((request_id_var, request_id_var.set(request_id)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Stamp records with the persona and request IDs of the calling context.
+
+    Context variables are only visible from the thread that logged the record,
+    so this filter has to run before the record is handed to the queue.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.persona_id = persona_id_var.get()
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Drop bursts of repetitive warning and error records.
+
+    Records are keyed by logger, level and unformatted message template, so a
+    retry storm logging the same error with different arguments collapses into
+    a handful of records per window. The first record let through after a
+    window rolls over carries a ``suppressed`` count of what was dropped, and
+    ``flush`` reports the counts of windows no further record arrived for.
+    """
+
+    SUMMARY = "Suppressed %d repetitive records: %s"
+
+    def __init__(
+        self,
+        window: float = 60.0,
+        burst: int = 5,
+        min_level: int = logging.WARNING
+    ):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.min_level = min_level
+        self._buckets: Dict[Tuple[str, int, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.min_level or getattr(record, "suppressed", 0):
+            return True
+
+        key = (record.name, record.levelno, str(record.msg))
+        now = record.created
+        bucket = self._buckets.get(key)
+        if bucket is None or now - bucket[0] >= self.window:
+            suppressed = bucket[2] if bucket else 0
+            self._buckets[key] = [now, 1, 0]
+            if suppressed:
+                record.suppressed = suppressed
+            return True
+
+        if bucket[1] < self.burst:
+            bucket[1] += 1
+            return True
+
+        bucket[2] += 1
+        return False
+
+    def flush(self, now: float, force: bool = False) -> List[logging.LogRecord]:
+        """Collect summaries of suppressed records and drop ended windows.
+
+        Args:
+            now: Current timestamp
+            force: Also report windows that have not ended yet
+
+        Returns:
+            One summary record per key with suppressed records
+        """
+        summaries = []
+        for key, bucket in list(self._buckets.items()):
+            ended = now - bucket[0] >= self.window
+            if bucket[2] and (ended or force):
+                name, level, msg = key
+                summary = logging.LogRecord(
+                    name, level, "", 0, self.SUMMARY, (bucket[2], msg), None
+                )
+                summary.created = now
+                summary.suppressed = bucket[2]
+                summaries.append(summary)
+                bucket[2] = 0
+            if ended:
+                del self._buckets[key]
+        return summaries
+
+
+class SamplingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that reports suppressed records once their window ends.
+
+    The listener wakes up at least once per sampling window, even when the
+    queue is idle, so the count of a burst that stopped is still logged.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        handler: logging.Handler,
+        sampler: SamplingFilter
+    ):
+        super().__init__(log_queue, handler, respect_handler_level=True)
+        self.sampler = sampler
+        self._next_flush = time.time() + sampler.window
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                record = self.queue.get(block, max(0.0, self._next_flush - time.time()))
+                received = True
+            except queue.Empty:
+                if not block:
+                    raise
+                received = False
+
+            if time.time() >= self._next_flush:
+                self.flush_suppressed()
+                self._next_flush = time.time() + self.sampler.window
+            if received:
+                return record
+
+    def flush_suppressed(self, force: bool = False) -> None:
+        """Log summaries of suppressed records.
+
+        Args:
+            force: Also report windows that have not ended yet
+        """
+        for record in self.sampler.flush(time.time(), force=force):
+            self.handle(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+
+        persona_id = getattr(record, "persona_id", None)
+        if persona_id:
+            entry["persona_id"] = persona_id
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that defers formatting and never blocks the caller.
+
+    Unlike the stdlib handler, records are enqueued without merging their
+    arguments, so string formatting happens on the listener thread. When the
+    queue is full the record is dropped and counted instead of waiting.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(
+    fmt: Optional[str] = None,
+    level: Optional[str] = None,
+    use_queue: Optional[bool] = None,
+    queue_size: int = 10000,
+    sample_window: float = 60.0,
+    sample_burst: int = 5
+) -> None:
+    """Configure the root logger.
+
+    Unset arguments are read from the ``LOG_FORMAT`` (``text`` or ``json``),
+    ``LOG_LEVEL`` and ``LOG_ASYNC`` environment variables, where empty values
+    count as unset. Asynchronous logging defaults to on for the JSON format.
+
+    Args:
+        fmt: Output format, ``text`` or ``json``
+        level: Root log level name
+        use_queue: Write records from a background thread
+        queue_size: Maximum number of records waiting to be written
+        sample_window: Seconds over which repetitive records are sampled
+        sample_burst: Repetitive records let through per window
+    """
+    global _listener
+
+    fmt = (fmt or os.getenv("LOG_FORMAT") or "text").lower()
+    level = (level or os.getenv("LOG_LEVEL") or "INFO").upper()
+    if use_queue is None:
+        default = "true" if fmt == "json" else "false"
+        use_queue = (os.getenv("LOG_ASYNC") or default).lower() in ("1", "true", "yes")
+
+    shutdown_logging()
+
+    root = logging.getLogger()
+    for handler in _handlers:
+        root.removeHandler(handler)
+        handler.close()
+    _handlers.clear()
+    root.setLevel(level)
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if fmt == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    if not use_queue:
+        stream_handler.addFilter(ContextFilter())
+        root.addHandler(stream_handler)
+        _handlers.append(stream_handler)
+        return
+
+    sampler = SamplingFilter(window=sample_window, burst=sample_burst)
+    stream_handler.addFilter(sampler)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+    root.addHandler(queue_handler)
+    _handlers.append(queue_handler)
+
+    _listener = SamplingQueueListener(log_queue, stream_handler, sampler)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and suppressed counts, then stop the background writer."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener.flush_suppressed(force=True)
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+__all__ = [
+    "JsonFormatter",
+    "NonBlockingQueueHandler",
+    "SamplingFilter",
+    "SamplingQueueListener",
+    "configure_logging",
+    "log_context",
+    "new_request_id",
+    "shutdown_logging",
+]
@@ -0,0 +1,294 @@
+"""LLM token and cost accounting with budget-aware throttling."""
+
+import json
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict
+from pathlib import Path
+from typing import Deque, Dict, Optional, Tuple
+
+from src.models.types import BudgetDecision, UsageRecord
+
+logger = logging.getLogger(__name__)
+
+# USD per million (prompt, completion) tokens. Dated snapshots such as
+# ``gpt-4o-2024-08-06`` are priced by their model family.
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4": (30.00, 60.00),
+    "o1-mini": (3.00, 12.00),
+    "o1": (15.00, 60.00),
+    "o3-mini": (1.10, 4.40),
+    "o3": (2.00, 8.00),
+    "o4-mini": (1.10, 4.40),
+}
+
+
+def model_price(
+    model: str,
+    prices: Optional[Dict[str, Tuple[float, float]]] = None
+) -> Optional[Tuple[float, float]]:
+    """Look up the price of a model by exact name or model family.
+
+    A model belongs to a family when its name is the family name followed by
+    a ``-`` suffix. The longest matching family wins, so
+    ``gpt-4o-mini-2024-07-18`` is priced as ``gpt-4o-mini``, not ``gpt-4o``.
+
+    Args:
+        model: Model name
+        prices: Price table, defaults to ``MODEL_PRICES``
+
+    Returns:
+        USD per million (prompt, completion) tokens, None if unknown
+    """
+    prices = MODEL_PRICES if prices is None else prices
+    if model in prices:
+        return prices[model]
+
+    family = max(
+        (name for name in prices if model.startswith(name + "-")),
+        key=len,
+        default=None
+    )
+    return prices[family] if family else None
+
+
+def estimate_cost(
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    prices: Optional[Dict[str, Tuple[float, float]]] = None
+) -> float:
+    """Estimate the USD cost of a completion.
+
+    Args:
+        model: Model that served the completion
+        prompt_tokens: Tokens in the prompt
+        completion_tokens: Tokens in the completion
+        prices: Price table, defaults to ``MODEL_PRICES``
+
+    Returns:
+        Estimated cost, 0.0 for models without a known price
+    """
+    prompt_price, completion_price = model_price(model, prices) or (0.0, 0.0)
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+class UsageLedger:
+    """Persists token usage and keeps rolling-window aggregates.
+
+    Every completion is appended to a JSON lines file so accounting survives
+    restarts. Records inside the rolling window are also kept in memory; on
+    startup they are reloaded from the file. ``prices`` extends and overrides
+    ``MODEL_PRICES``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        window_seconds: float = 86400.0,
+        prices: Optional[Dict[str, Tuple[float, float]]] = None
+    ):
+        self.path = Path(path)
+        self.window_seconds = window_seconds
+        self.prices = {**MODEL_PRICES, **(prices or {})}
+        self._lock = threading.Lock()
+        self._records: Deque[UsageRecord] = deque()
+        self._load()
+
+    def _load(self) -> None:
+        """Reload the records still inside the window."""
+        if not self.path.exists():
+            return
+
+        cutoff = time.time() - self.window_seconds
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = UsageRecord(**json.loads(line))
+                except (TypeError, ValueError) as e:
+                    logger.warning("Skipping malformed usage record: %s", e)
+                    continue
+                if record.timestamp >= cutoff:
+                    self._records.append(record)
+
+    def record(
+        self,
+        persona_id: str,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        timestamp: Optional[float] = None
+    ) -> UsageRecord:
+        """Account for a completion.
+
+        Args:
+            persona_id: Persona the completion was generated for
+            model: Model that served the completion
+            prompt_tokens: Tokens in the prompt
+            completion_tokens: Tokens in the completion
+            timestamp: Time of the completion, defaults to now
+
+        Returns:
+            The stored usage record
+        """
+        record = UsageRecord(
+            timestamp=time.time() if timestamp is None else timestamp,
+            persona_id=persona_id,
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost=estimate_cost(model, prompt_tokens, completion_tokens, self.prices)
+        )
+
+        with self._lock:
+            self._records.append(record)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write(json.dumps(asdict(record), separators=(",", ":")) + "\n")
+            except OSError as e:
+                logger.error("Failed to persist usage record: %s", e)
+
+        return record
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by in-window records."""
+        with self._lock:
+            return sum(sys.getsizeof(record) for record in self._records)
+            
+    def _prune(self, now: float) -> None:
+        """Drop records that fell out of the window."""
+        cutoff = now - self.window_seconds
+        while self._records and self._records[0].timestamp < cutoff:
+            self._records.popleft()
+
+    def totals(self, persona_id: str, now: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        """Aggregate a persona's usage per model over the window.
+
+        Args:
+            persona_id: Persona to aggregate
+            now: End of the window, defaults to now
+
+        Returns:
+            Mapping of model to prompt_tokens, completion_tokens and cost
+        """
+        with self._lock:
+            self._prune(time.time() if now is None else now)
+            totals: Dict[str, Dict[str, float]] = {}
+            for record in self._records:
+                if record.persona_id != persona_id:
+                    continue
+                model_totals = totals.setdefault(
+                    record.model,
+                    {"prompt_tokens": 0, "completion_tokens": 0, "cost": 0.0}
+                )
+                model_totals["prompt_tokens"] += record.prompt_tokens
+                model_totals["completion_tokens"] += record.completion_tokens
+                model_totals["cost"] += record.cost
+            return totals
+
+    def spend(self, persona_id: str, now: Optional[float] = None) -> float:
+        """Total cost of a persona's completions over the window."""
+        return sum(t["cost"] for t in self.totals(persona_id, now).values())
+
+
+class BudgetPolicy:
+    """Throttles generation as a persona approaches its spend budget.
+
+    Below ``soft_ratio`` of the budget completions run as configured. Past it,
+    the model is downgraded to ``fallback_model`` when that is cheaper and
+    ``max_tokens`` is lowered. Once the budget is spent, post cycles are
+    skipped until older usage rolls out of the window.
+    """
+
+    def __init__(
+        self,
+        ledger: UsageLedger,
+        budget_usd: float,
+        soft_ratio: float = 0.8,
+        fallback_model: str = "gpt-4o-mini",
+        reduced_max_tokens: int = 60
+    ):
+        self.ledger = ledger
+        self.budget_usd = budget_usd
+        self.soft_ratio = soft_ratio
+        self.fallback_model = fallback_model
+        self.reduced_max_tokens = reduced_max_tokens
+
+    def validate_model(self, model: str) -> None:
+        """Refuse to enforce a budget on a model without a known price.
+
+        Completions of such a model would be costed at $0.00 and never count
+        towards the budget. A fallback model without a price is never switched
+        to, so it only warrants a warning.
+
+        Args:
+            model: Configured model
+
+        Raises:
+            ValueError: If a budget is set and the model has no known price
+        """
+        if self.budget_usd <= 0:
+            return
+
+        if model_price(model, self.ledger.prices) is None:
+            raise ValueError(
+                f"No price known for model {model!r}, cannot enforce BUDGET_USD; "
+                "set its price with MODEL_PRICES"
+            )
+        if model_price(self.fallback_model, self.ledger.prices) is None:
+            logger.warning(
+                "No price known for fallback model %s, budget throttling will not downgrade",
+                self.fallback_model
+            )
+
+    def plan(self, persona_id: str, model: str, max_tokens: int) -> BudgetDecision:
+        """Decide model and token limit for a persona's next completion.
+
+        Args:
+            persona_id: Persona about to generate
+            model: Configured model
+            max_tokens: Configured completion token limit
+
+        Returns:
+            Decision to apply to the next completion
+        """
+        if self.budget_usd <= 0:
+            return BudgetDecision(model, max_tokens)
+
+        spend = self.ledger.spend(persona_id)
+        if spend >= self.budget_usd:
+            return BudgetDecision(
+                model, max_tokens, skip=True,
+                reason=f"spent ${spend:.4f} of ${self.budget_usd:.2f} budget"
+            )
+
+        if spend >= self.budget_usd * self.soft_ratio:
+            prices = self.ledger.prices
+            if _price(self.fallback_model, prices) < _price(model, prices):
+                model = self.fallback_model
+            return BudgetDecision(
+                model, min(max_tokens, self.reduced_max_tokens),
+                reason=f"spent ${spend:.4f} of ${self.budget_usd:.2f} budget"
+            )
+
+        return BudgetDecision(model, max_tokens)
+
+
+def _price(model: str, prices: Dict[str, Tuple[float, float]]) -> float:
+    """Blended per-token price used to rank models."""
+    prompt_price, completion_price = model_price(model, prices) or (float("inf"), float("inf"))
+    return prompt_price + completion_price
@@ -0,0 +1,330 @@
+"""Ingestion and caching of current context for tweet prompts."""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.clients import FeedClient, TwitterClient
+from src.models.types import ContextSnippet
+
+logger = logging.getLogger(__name__)
+
+STOPWORDS = frozenset("""
+    about above after again against also because been before being below between
+    both could does doing down during each from further have having here into
+    itself just more most only other over same should some such than that their
+    them then there these they this those through under until very what when
+    where which while will with would your yours you are and the for not but
+    can our out its who how all any was were has had him her his she
+    an as at be by do if in is it me my no of on or so to up us we
+""".split())
+
+_TOKEN_RE = re.compile(r"[#@]?[a-z0-9][a-z0-9'_-]+")
+
+
+def tokenize(text: str) -> Set[str]:
+    """Extract rankable keywords from text.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Lowercase tokens of at least two characters, without stopwords
+    """
+    tokens = set()
+    for token in _TOKEN_RE.findall(text.lower()):
+        token = token.lstrip("#@")
+        if len(token) >= 2 and token not in STOPWORDS:
+            tokens.add(token)
+    return tokens
+
+
+class ContextCache:
+    """Local cache of context snippets with TTL and keyword ranking.
+
+    Snippets are scored against the persona's keywords when they are added,
+    and a ranked list is rebuilt once per ingestion batch. Reading the top
+    snippets for a prompt therefore only walks the head of that list instead
+    of scoring the whole cache on the posting path. The cache, together with
+    the conditional request validators of each source, is persisted so a
+    restart does not refetch unchanged feeds.
+
+    Persistence is an append-only JSON lines journal: each save appends only
+    the snippets added since the last one and, if they changed, the source
+    validators. Expired and evicted snippets are dropped again on load, and
+    the journal is compacted once it holds far more lines than live entries.
+    """
+
+    COMPACT_SLACK = 100
+
+    def __init__(
+        self,
+        path: str,
+        keywords: Iterable[str],
+        ttl_seconds: float = 86400.0,
+        max_snippets: int = 500
+    ):
+        self.path = Path(path)
+        self.keywords = {k for keyword in keywords for k in tokenize(keyword)}
+        self.ttl_seconds = ttl_seconds
+        self.max_snippets = max_snippets
+        self._lock = threading.Lock()
+        self._snippets: Dict[str, ContextSnippet] = {}
+        self._scores: Dict[str, int] = {}
+        self._ranked: List[str] = []
+        self._pending: List[ContextSnippet] = []
+        self._journal_lines = 0
+        self._saved_sources = "{}"
+        self.sources: Dict[str, Dict[str, Optional[str]]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Replay the persisted journal."""
+        if not self.path.exists():
+            return
+
+        snippets = []
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    self._journal_lines += 1
+                    try:
+                        entry = json.loads(line)
+                        if "sources" in entry:
+                            self.sources = entry["sources"]
+                        else:
+                            snippets.append(ContextSnippet(**entry["snippet"]))
+                    except (KeyError, TypeError, ValueError) as e:
+                        logger.warning("Skipping malformed context cache entry: %s", e)
+        except OSError as e:
+            logger.warning("Discarding unreadable context cache %s: %s", self.path, e)
+            return
+
+        self._saved_sources = json.dumps(self.sources, sort_keys=True)
+        self.add(snippets, persist=False)
+        self._pending.clear()
+
+    def save(self) -> None:
+        """Append new snippets and changed source validators to the journal."""
+        with self._lock:
+            pending = [s for s in self._pending if s.id in self._snippets]
+            self._pending.clear()
+            sources = json.dumps(self.sources, sort_keys=True)
+            changed = sources != self._saved_sources
+            journal_lines = self._journal_lines + len(pending) + changed
+            if journal_lines > 2 * len(self._snippets) + self.COMPACT_SLACK:
+                self._compact(sources)
+                return
+
+            lines = [json.dumps({"snippet": asdict(s)}, separators=(",", ":")) for s in pending]
+            if changed:
+                lines.append(f'{{"sources":{sources}}}')
+            if not lines:
+                return
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError as e:
+                logger.error("Failed to persist context cache: %s", e)
+                return
+            self._journal_lines += len(lines)
+            self._saved_sources = sources
+
+    def _compact(self, sources: str) -> None:
+        """Atomically rewrite the journal with only the live entries."""
+        lines = [
+            json.dumps({"snippet": asdict(s)}, separators=(",", ":"))
+            for s in self._snippets.values()
+        ]
+        lines.append(f'{{"sources":{sources}}}')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error("Failed to compact context cache: %s", e)
+            return
+        self._journal_lines = len(lines)
+        self._saved_sources = sources
+
+    def add(self, snippets: Iterable[ContextSnippet], persist: bool = True) -> int:
+        """Add new snippets, ignoring ones already cached.
+
+        Args:
+            snippets: Snippets to add
+            persist: Save the cache afterwards
+
+        Returns:
+            Number of snippets added
+        """
+        now = time.time()
+        added = 0
+        with self._lock:
+            for snippet in snippets:
+                if snippet.id in self._snippets or self._expired(snippet, now):
+                    continue
+                self._snippets[snippet.id] = snippet
+                self._pending.append(snippet)
+                self._scores[snippet.id] = len(tokenize(snippet.text) & self.keywords)
+                added += 1
+
+            self._evict(now)
+            self._rank()
+
+        if persist and added:
+            self.save()
+        return added
+
+    def top(self, k: int) -> List[ContextSnippet]:
+        """Return the k most relevant unexpired snippets.
+
+        Args:
+            k: Number of snippets
+
+        Returns:
+            Snippets ordered by keyword overlap, then recency
+        """
+        now = time.time()
+        result = []
+        with self._lock:
+            for snippet_id in self._ranked:
+                snippet = self._snippets.get(snippet_id)
+                if snippet and not self._expired(snippet, now):
+                    result.append(snippet)
+                    if len(result) == k:
+                        break
+        return result
+
+    def __len__(self) -> int:
+        return len(self._snippets)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by cached snippets."""
+        with self._lock:
+            return sum(
+                sys.getsizeof(snippet) + sys.getsizeof(snippet.text) + sys.getsizeof(snippet.url)
+                for snippet in self._snippets.values()
+            )
+
+    def _expired(self, snippet: ContextSnippet, now: float) -> bool:
+        """Whether a snippet is past its TTL."""
+        return (snippet.published or snippet.fetched_at) + self.ttl_seconds < now
+
+    def _evict(self, now: float) -> None:
+        """Drop expired snippets and the oldest ones beyond the size limit."""
+        stale = [sid for sid, snippet in self._snippets.items() if self._expired(snippet, now)]
+        overflow = len(self._snippets) - len(stale) - self.max_snippets
+        if overflow > 0:
+            stale_ids = set(stale)
+            fresh = sorted(
+                (s for sid, s in self._snippets.items() if sid not in stale_ids),
+                key=self._recency
+            )
+            stale.extend(snippet.id for snippet in fresh[:overflow])
+
+        for snippet_id in stale:
+            del self._snippets[snippet_id]
+            self._scores.pop(snippet_id, None)
+
+    def _rank(self) -> None:
+        """Rebuild the relevance ranking."""
+        candidates = [
+            sid for sid in self._snippets
+            if self._scores[sid] > 0 or not self.keywords
+        ]
+        candidates.sort(
+            key=lambda sid: (self._scores[sid], self._recency(self._snippets[sid])),
+            reverse=True
+        )
+        self._ranked = candidates
+
+    @staticmethod
+    def _recency(snippet: ContextSnippet) -> float:
+        """Timestamp used to order snippets by freshness."""
+        return snippet.published or snippet.fetched_at
+
+
+class ContextIngestor:
+    """Periodically refreshes the context cache off the posting path."""
+
+    TIMELINE_SOURCE = "twitter:timeline"
+
+    def __init__(
+        self,
+        cache: ContextCache,
+        feeds: List[str],
+        feed_client: Optional[FeedClient] = None,
+        twitter_client: Optional[TwitterClient] = None,
+        interval_seconds: float = 1800.0
+    ):
+        self.cache = cache
+        self.feeds = feeds
+        self.feed_client = feed_client or FeedClient()
+        self.twitter_client = twitter_client
+        self.interval_seconds = interval_seconds
+
+    def refresh(self) -> int:
+        """Fetch every source once.
+
+        Returns:
+            Number of new snippets cached
+        """
+        snippets: List[ContextSnippet] = []
+
+        for url in self.feeds:
+            validators = self.cache.sources.get(url, {})
+            try:
+                result = self.feed_client.fetch(
+                    url,
+                    etag=validators.get("etag"),
+                    last_modified=validators.get("last_modified")
+                )
+            except Exception as e:
+                logger.warning("Failed to fetch context feed %s: %s", url, e)
+                continue
+
+            if result.not_modified:
+                logger.debug("Context feed %s not modified", url)
+                continue
+            self.cache.sources[url] = {"etag": result.etag, "last_modified": result.last_modified}
+            snippets.extend(result.snippets)
+
+        if self.twitter_client:
+            validators = self.cache.sources.get(self.TIMELINE_SOURCE, {})
+            try:
+                tweets = self.twitter_client.get_recent_tweets(since_id=validators.get("since_id"))
+            except Exception as e:
+                logger.warning("Failed to fetch own timeline: %s", e)
+                tweets = []
+            if tweets:
+                newest = max(tweets, key=lambda tweet: int(tweet.id))
+                self.cache.sources[self.TIMELINE_SOURCE] = {"since_id": newest.id}
+                snippets.extend(tweets)
+
+        added = self.cache.add(snippets, persist=False)
+        self.cache.save()
+        logger.info("Context refresh cached %d new snippets (%d total)", added, len(self.cache))
+        return added
+
+    async def run(self) -> None:
+        """Refresh the cache now and then every interval until cancelled."""
+        while True:
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception as e:
+                logger.error("Context refresh failed: %s", e)
+            await asyncio.sleep(self.interval_seconds)
@@ -0,0 +1,68 @@
+"""Compact tweet history storage."""
+
+from array import array
+from typing import Iterator, List, Union, overload
+
+
+class TweetHistory:
+    """Bounded history of tweets stored as UTF-8 in a single buffer.
+
+    Keeping the text in one ``bytearray`` with an ``array`` of end offsets
+    avoids a Python string object per entry while the history sits idle
+    between post cycles. Entries are decoded on access. Appending beyond
+    ``maxlen`` evicts the oldest entry.
+    """
+
+    __slots__ = ("maxlen", "_data", "_ends")
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self._data = bytearray()
+        self._ends = array("I")
+
+    def append(self, text: str) -> None:
+        """Add a tweet, evicting the oldest one when full.
+
+        Args:
+            text: Tweet text
+        """
+        self._data += text.encode("utf-8")
+        self._ends.append(len(self._data))
+        if len(self._ends) > self.maxlen:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest entry and shift the remaining offsets."""
+        cut = self._ends[0]
+        del self._data[:cut]
+        self._ends = array("I", (end - cut for end in self._ends[1:]))
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+
+        start = self._ends[index - 1] if index else 0
+        return self._data[start:self._ends[index]].decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the stored tweets."""
+        return len(self._data) + self._ends.itemsize * len(self._ends)
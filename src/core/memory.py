@@ -0,0 +1,169 @@
+"""Memory budget enforcement for personas sharing one process."""
+
+import asyncio
+import gc
+import logging
+import os
+import resource
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from .persona_bot import PersonaBot
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # Peak rather than current RSS, but the best portable fallback.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class MemoryGuard:
+    """Pauses or sheds personas before the process outgrows its budget.
+
+    Each registered persona is attributed the RSS growth measured while it
+    was created plus the size of the state it keeps between cycles. Above
+    ``soft_ratio`` of the budget the largest active persona is paused, at
+    most once per ``pause_cooldown_seconds`` since pausing frees no memory
+    by itself and usage needs time to respond. The last active persona is
+    never paused, as that would stop all posting without relieving memory.
+    Above ``hard_ratio`` the largest persona, paused or not, is shed:
+    stopped for good with its state released. Paused personas resume one at
+    a time once usage falls below ``resume_ratio``.
+    """
+
+    def __init__(
+        self,
+        budget_mb: int,
+        soft_ratio: float = 0.85,
+        hard_ratio: float = 0.95,
+        resume_ratio: float = 0.75,
+        pause_cooldown_seconds: float = 300.0
+    ):
+        self.budget_bytes = budget_mb * MB
+        self.soft_ratio = soft_ratio
+        self.hard_ratio = hard_ratio
+        self.resume_ratio = resume_ratio
+        self.pause_cooldown_seconds = pause_cooldown_seconds
+        self.bots: List["PersonaBot"] = []
+        self._baselines: Dict[str, int] = {}
+        self._last_pause = float("-inf")
+
+    @contextmanager
+    def measure(self) -> Iterator[Dict[str, int]]:
+        """Measure RSS growth of a block, typically a persona's creation.
+
+        Yields:
+            Dict whose ``delta`` key holds the growth in bytes once the block exits
+        """
+        result = {"delta": 0}
+        before = current_rss()
+        try:
+            yield result
+        finally:
+            result["delta"] = max(0, current_rss() - before)
+
+    def register(self, bot: "PersonaBot", baseline: int = 0) -> None:
+        """Start guarding a persona.
+
+        Args:
+            bot: Persona to guard
+            baseline: RSS growth attributed to creating the persona
+        """
+        self.bots.append(bot)
+        self._baselines[bot.settings.persona_id] = baseline
+
+    def attribution(self) -> Dict[str, int]:
+        """Estimate bytes attributable to each guarded persona."""
+        return {
+            bot.settings.persona_id:
+                self._baselines.get(bot.settings.persona_id, 0) + bot.memory_footprint()
+            for bot in self.bots
+        }
+
+    def report(self, rss: Optional[int] = None) -> str:
+        """Render RSS usage and per-persona attribution."""
+        rss = current_rss() if rss is None else rss
+        attribution = self.attribution()
+        lines = [
+            f"RSS {rss / MB:.1f} MB of {self.budget_bytes / MB:.0f} MB budget, "
+            f"{(rss - sum(attribution.values())) / MB:.1f} MB shared"
+        ]
+        for bot in sorted(self.bots, key=lambda b: attribution[b.settings.persona_id], reverse=True):
+            state = "paused" if bot.paused else "running" if bot.running else "stopped"
+            lines.append(
+                f"  {bot.settings.persona_id}: {attribution[bot.settings.persona_id] / 1024:.1f} KB ({state})"
+            )
+        return "\n".join(lines)
+
+    def check(self, rss: Optional[int] = None, now: Optional[float] = None) -> Optional[str]:
+        """Enforce the budget once.
+
+        Args:
+            rss: Current RSS in bytes, measured when not given
+            now: Current monotonic time, measured when not given
+
+        Returns:
+            Persona ID that was paused, shed or resumed, or None
+        """
+        if self.budget_bytes <= 0:
+            return None
+
+        rss = current_rss() if rss is None else rss
+        now = time.monotonic() if now is None else now
+        attribution = self.attribution()
+        running = [bot for bot in self.bots if bot.running]
+        running.sort(key=lambda b: attribution[b.settings.persona_id], reverse=True)
+
+        if rss >= self.budget_bytes * self.hard_ratio and running:
+            bot = running[0]
+            logger.error(
+                "RSS %.1f MB over hard limit, shedding persona %s\n%s",
+                rss / MB, bot.settings.persona_id, self.report(rss)
+            )
+            self.bots.remove(bot)
+            self._baselines.pop(bot.settings.persona_id, None)
+            bot.release()
+            gc.collect()
+            return bot.settings.persona_id
+
+        if rss >= self.budget_bytes * self.soft_ratio:
+            active = [bot for bot in running if not bot.paused]
+            if len(active) > 1 and now - self._last_pause >= self.pause_cooldown_seconds:
+                bot = active[0]
+                logger.warning(
+                    "RSS %.1f MB over soft limit, pausing persona %s\n%s",
+                    rss / MB, bot.settings.persona_id, self.report(rss)
+                )
+                bot.pause()
+                self._last_pause = now
+                gc.collect()
+                return bot.settings.persona_id
+            return None
+
+        if rss < self.budget_bytes * self.resume_ratio:
+            for bot in self.bots:
+                if bot.paused and bot.running:
+                    logger.info("RSS %.1f MB, resuming persona %s", rss / MB, bot.settings.persona_id)
+                    bot.resume()
+                    return bot.settings.persona_id
+
+        return None
+
+    async def run(self, interval_seconds: float = 30.0) -> None:
+        """Check the budget every interval until cancelled."""
+        while True:
+            try:
+                self.check()
+            except Exception as e:
+                logger.error("Memory check failed: %s", e)
+            await asyncio.sleep(interval_seconds)
@@ -2,10 +2,16 @@
 
 import asyncio
 import logging
+import os
 
-from src.clients import OpenAIClient, TwitterClient
+from src.clients import Cassette, OpenAIClient, TwitterClient
+from src.config.log import log_context, new_request_id
 from src.models.types import Settings
+from src.profiling import CycleProfiler, profile_stage
 
+from .budget import BudgetPolicy, UsageLedger
+from .context import ContextCache, ContextIngestor
+from .history import TweetHistory
 from .scheduler import TweetScheduler
 from .tweet_generator import TweetGenerator
 
@@ -15,30 +21,83 @@ logger = logging.getLogger(__name__)
 class PersonaBot:
     """Twitter persona bot that posts AI-generated tweets."""
     
+    MAX_TWEET_TOKENS = 100
+    POLL_INTERVAL_SECONDS = 60
+    ERROR_BACKOFF_SECONDS = 300
+    
     def __init__(self, settings: Settings):
         self.settings = settings
         self.running = False
+        self.paused = False
+        self._ingest_task = None
+        
+        self.cassette = None
+        if settings.cassette_mode:
+            self.cassette = Cassette(
+                settings.cassette_path,
+                settings.cassette_mode,
+                latency_scale=settings.cassette_latency_scale
+            )
         
         self.twitter_client = TwitterClient(
             api_key=settings.twitter_api_key,
             api_secret=settings.twitter_api_secret,
             access_token=settings.twitter_access_token,
-            access_token_secret=settings.twitter_access_token_secret
+            access_token_secret=settings.twitter_access_token_secret,
+            cassette=self.cassette,
+            compact=settings.memory_compact
+        )
+        
+        self.usage_ledger = UsageLedger(
+            os.path.join(settings.data_dir, "usage.jsonl"),
+            window_seconds=settings.budget_window_hours * 3600,
+            prices=settings.model_prices
         )
+        self.budget = BudgetPolicy(
+            self.usage_ledger,
+            budget_usd=settings.budget_usd,
+            fallback_model=settings.budget_fallback_model
+        )
+        self.budget.validate_model(settings.openai_model)
         
         self.openai_client = OpenAIClient(
             api_key=settings.openai_api_key,
-            model=settings.openai_model
+            model=settings.openai_model,
+            cassette=self.cassette,
+            usage_callback=self._record_usage
+        )
+        
+        self.profiler = CycleProfiler(
+            os.path.join(settings.data_dir, "profiles"),
+            enabled=settings.profile_enabled,
+            sample_every=settings.profile_sample_every
         )
         
-        self.tweet_generator = TweetGenerator(settings, self.openai_client)
+        self.context_cache = None
+        self.context_ingestor = None
+        if settings.context_feeds or settings.context_own_timeline:
+            self.context_cache = ContextCache(
+                os.path.join(settings.data_dir, "context_cache.jsonl"),
+                keywords=settings.context_keywords or [settings.system_prompt],
+                ttl_seconds=settings.context_ttl_hours * 3600
+            )
+            self.context_ingestor = ContextIngestor(
+                self.context_cache,
+                feeds=settings.context_feeds,
+                twitter_client=self.twitter_client if settings.context_own_timeline else None,
+                interval_seconds=settings.context_refresh_minutes * 60
+            )
+        
+        self.tweet_generator = TweetGenerator(settings, self.openai_client, self.context_cache)
         self.scheduler = TweetScheduler()
         
     def initialize(self) -> None:
         """Initialize the bot and its connections."""
         logger.info("Initializing Twitter Persona Bot")
-        logger.info(f"Persona: {self.settings.system_prompt}")
-        logger.info(f"OpenAI Model: {self.settings.openai_model}")
+        logger.info("Persona: %s", self.settings.system_prompt)
+        logger.info("OpenAI Model: %s", self.settings.openai_model)
+        if self.cassette:
+            logger.info("Cassette %s mode: %s", self.cassette.mode, self.cassette.path)
         self.twitter_client.connect()
         
     def post_tweet(self) -> bool:
@@ -47,36 +106,130 @@ class PersonaBot:
         Returns:
             True if tweet was posted successfully, False otherwise
         """
-        try:
-            tweet_text = self.tweet_generator.generate()
-            if not tweet_text:
-                logger.error("Failed to generate tweet content")
-                return False
+        request_id = new_request_id()
+        with log_context(persona_id=self.settings.persona_id, request_id=request_id), \
+                self.profiler.cycle(self.settings.persona_id, request_id):
+            try:
+                if self.paused:
+                    logger.warning("Persona paused, skipping post cycle")
+                    return False
+                    
+                decision = self.budget.plan(
+                    self.settings.persona_id, self.settings.openai_model, self.MAX_TWEET_TOKENS
+                )
+                if decision.skip:
+                    logger.warning("Skipping post cycle, %s", decision.reason)
+                    return False
+                if decision.reason:
+                    logger.warning(
+                        "Throttling to %s with max_tokens=%d, %s",
+                        decision.model, decision.max_tokens, decision.reason
+                    )
+                    
+                with profile_stage("generate"):
+                    tweet_text = self.tweet_generator.generate(
+                        model=decision.model, max_tokens=decision.max_tokens
+                    )
+                if not tweet_text:
+                    logger.error("Failed to generate tweet content")
+                    return False
+                    
+                tweet_id = self.twitter_client.post_tweet(tweet_text)
+                return tweet_id is not None
                 
-            tweet_id = self.twitter_client.post_tweet(tweet_text)
-            return tweet_id is not None
-            
-        except Exception as e:
-            logger.error(f"Error posting tweet: {e}")
-            return False
+            except Exception as e:
+                logger.error("Error posting tweet: %s", e)
+                return False
             
     async def run(self) -> None:
         """Run the bot continuously."""
         self.initialize()
         self.running = True
         
+        if not self.paused:
+            self._start_ingestion()
+        
         self.post_tweet()
         
         self.scheduler.schedule_tweets(self.post_tweet)
         while self.running:
             try:
                 self.scheduler.run_pending()
-                await asyncio.sleep(60)
+                await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
             except asyncio.CancelledError:
                 logger.info("Bot operation cancelled")
                 break
             except Exception as e:
-                logger.error(f"Unexpected error in main loop: {e}")
-                await asyncio.sleep(300)
+                logger.error("Unexpected error in main loop: %s", e)
+                await asyncio.sleep(self.ERROR_BACKOFF_SECONDS)
                 
-        logger.info("PersonaBot stopped")
\ No newline at end of file
+        if self._ingest_task:
+            self._ingest_task.cancel()
+        if self.cassette:
+            self.cassette.close()
+        logger.info("PersonaBot stopped")
+        
+    def stop(self) -> None:
+        """Stop the bot after the current loop iteration."""
+        self.running = False
+        
+    def pause(self) -> None:
+        """Skip post cycles and suspend context ingestion until resumed."""
+        self.paused = True
+        if self._ingest_task:
+            self._ingest_task.cancel()
+            self._ingest_task = None
+            
+    def resume(self) -> None:
+        """Resume post cycles and context ingestion.
+        
+        Must be called from the event loop the bot runs on.
+        """
+        self.paused = False
+        if self.running:
+            self._start_ingestion()
+            
+    def _start_ingestion(self) -> None:
+        """Start background context ingestion unless it is already running."""
+        if self.context_ingestor and not self._ingest_task:
+            self._ingest_task = asyncio.create_task(self.context_ingestor.run())
+        
+    def release(self) -> None:
+        """Stop the bot for good and drop the state it holds.
+        
+        Pausing or stopping alone frees nothing while the bot keeps its
+        clients, history and context cache, so a shed persona lets go of
+        them for the memory to be reclaimed.
+        """
+        self.stop()
+        if self._ingest_task:
+            self._ingest_task.cancel()
+        self.scheduler.clear()
+        self.context_ingestor = None
+        self.context_cache = None
+        self.tweet_generator.context_cache = None
+        self.tweet_generator.tweet_history = TweetHistory(TweetGenerator.MAX_HISTORY_SIZE)
+        self.twitter_client = None
+        
+    def memory_footprint(self) -> int:
+        """Approximate bytes of state this bot keeps between post cycles."""
+        footprint = self.tweet_generator.tweet_history.nbytes + self.usage_ledger.nbytes
+        if self.context_cache:
+            footprint += self.context_cache.nbytes
+        return footprint
+        
+    def _record_usage(self, model: str, prompt_tokens: int, completion_tokens: int) -> None:
+        """Account for the tokens of a completion.
+        
+        Args:
+            model: Model that served the completion
+            prompt_tokens: Tokens in the prompt
+            completion_tokens: Tokens in the completion
+        """
+        record = self.usage_ledger.record(
+            self.settings.persona_id, model, prompt_tokens, completion_tokens
+        )
+        logger.info(
+            "OpenAI usage: %s prompt=%d completion=%d cost=$%.5f",
+            model, prompt_tokens, completion_tokens, record.cost
+        )
\ No newline at end of file
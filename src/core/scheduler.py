@@ -1,7 +1,8 @@
 """Tweet scheduling logic."""
 
 import logging
-from typing import Callable
+from datetime import datetime
+from typing import Callable, Optional
 
 import schedule
 
@@ -12,7 +13,7 @@ class TweetScheduler:
     """Handles tweet scheduling."""
     
     def __init__(self):
-        pass
+        self._scheduler = schedule.Scheduler()
         
     def schedule_tweets(self, tweet_callback: Callable[[], bool]) -> None:
         """Schedule tweets every hour.
@@ -20,9 +21,22 @@ class TweetScheduler:
         Args:
             tweet_callback: Callback function to execute for posting tweets
         """
-        schedule.every(1).hours.do(tweet_callback)
+        self._scheduler.every(1).hours.do(tweet_callback)
         logger.info("Scheduled to tweet every hour")
         
     def run_pending(self) -> None:
         """Run any pending scheduled tasks."""
-        schedule.run_pending()
\ No newline at end of file
+        self._scheduler.run_pending()
+        
+    @property
+    def next_run(self) -> Optional[datetime]:
+        """When the next scheduled task is due, None if nothing is scheduled."""
+        return self._scheduler.next_run
+        
+    def pending_count(self) -> int:
+        """Number of scheduled tasks that are due."""
+        return sum(1 for job in self._scheduler.jobs if job.should_run)
+        
+    def clear(self) -> None:
+        """Cancel all scheduled tasks."""
+        self._scheduler.clear()
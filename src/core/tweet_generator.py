@@ -2,10 +2,14 @@
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 
 from src.clients import OpenAIClient
 from src.models.types import Settings
+from src.profiling import profile_stage
+
+from .context import ContextCache
+from .history import TweetHistory
 
 logger = logging.getLogger(__name__)
 
@@ -16,23 +20,34 @@ class TweetGenerator:
     MAX_HISTORY_SIZE = 10
     RECENT_TWEETS_FOR_CONTEXT = 3
     
-    def __init__(self, settings: Settings, openai_client: OpenAIClient):
+    def __init__(
+        self,
+        settings: Settings,
+        openai_client: OpenAIClient,
+        context_cache: Optional[ContextCache] = None
+    ):
         self.settings = settings
         self.openai_client = openai_client
-        self.tweet_history: List[str] = []
+        self.context_cache = context_cache
+        self.tweet_history = TweetHistory(self.MAX_HISTORY_SIZE)
         
-    def generate(self) -> Optional[str]:
+    def generate(self, model: Optional[str] = None, max_tokens: int = 100) -> Optional[str]:
         """Generate a new tweet.
         
+        Args:
+            model: Model to use instead of the client default
+            max_tokens: Maximum tokens in the tweet
+            
         Returns:
             Generated tweet text or None if generation failed
         """
-        prompt = self._build_prompt()
-        tweet = self.openai_client.generate_tweet(prompt)
+        with profile_stage("prompt.build"):
+            prompt = self._build_prompt()
+        tweet = self.openai_client.generate_tweet(prompt, model=model, max_tokens=max_tokens)
         
         if tweet:
             self._add_to_history(tweet)
-            logger.info(f"Generated tweet: {tweet}")
+            logger.info("Generated tweet: %s", tweet)
             
         return tweet
         
@@ -52,11 +67,21 @@ class TweetGenerator:
                 f"- {tweet}" for tweet in recent
             )
             
+        current_context = ""
+        if self.context_cache:
+            snippets = self.context_cache.top(self.settings.context_top_k)
+            if snippets:
+                current_context = "What's happening now (use if relevant):\n" + "\n".join(
+                    f"- {snippet.text}" for snippet in snippets
+                )
+            
         prompt = f"""
 {self.settings.system_prompt}
 
 {time_context}
 
+{current_context}
+
 Generate an engaging tweet that:
 1. Fits your persona perfectly
 2. Is under 280 characters
@@ -76,6 +101,4 @@ Tweet:"""
         Args:
             tweet: Tweet text to add to history
         """
-        self.tweet_history.append(tweet)
-        if len(self.tweet_history) > self.MAX_HISTORY_SIZE:
-            self.tweet_history.pop(0)
\ No newline at end of file
+        self.tweet_history.append(tweet)
\ No newline at end of file
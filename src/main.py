@@ -4,9 +4,10 @@ import asyncio
 import logging
 import signal
 import sys
-from typing import Optional
+from typing import List, Optional
 
-from src.config import load_settings
+from src.config import load_personas, shutdown_logging
+from src.core.memory import MemoryGuard
 from src.core.persona_bot import PersonaBot
 
 logger = logging.getLogger(__name__)
@@ -19,7 +20,7 @@ class GracefulShutdown:
     
     def __init__(self):
         self.shutdown_event = asyncio.Event()
-        self.bot: Optional[PersonaBot] = None
+        self.bots: List[PersonaBot] = []
         
     def handle_signal(self, signum: int, frame: Optional[object]) -> None:
         """Handle shutdown signals.
@@ -28,7 +29,7 @@ class GracefulShutdown:
             signum: Signal number
             frame: Current stack frame
         """
-        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+        logger.info("Received signal %s, initiating graceful shutdown...", signum)
         self.shutdown_event.set()
         
     async def wait_for_shutdown(self) -> None:
@@ -47,17 +48,24 @@ async def main() -> None:
     shutdown_handler.setup_signal_handlers()
     
     try:
-        settings = load_settings()
-        logger.info("Twitter Persona Bot starting...")
+        personas = load_personas()
+        logger.info("Twitter Persona Bot starting %d persona(s)...", len(personas))
         
-        bot = PersonaBot(settings)
-        shutdown_handler.bot = bot
+        guard = MemoryGuard(personas[0].memory_budget_mb)
+        for settings in personas:
+            with guard.measure() as creation:
+                bot = PersonaBot(settings)
+            guard.register(bot, baseline=creation["delta"])
+            shutdown_handler.bots.append(bot)
         
-        bot_task = asyncio.create_task(bot.run())
+        bots_task = asyncio.gather(*(bot.run() for bot in shutdown_handler.bots))
         shutdown_task = asyncio.create_task(shutdown_handler.wait_for_shutdown())
+        tasks = [bots_task, shutdown_task]
+        if guard.budget_bytes:
+            tasks.append(asyncio.create_task(guard.run()))
         
         done, pending = await asyncio.wait(
-            [bot_task, shutdown_task],
+            tasks,
             return_when=asyncio.FIRST_COMPLETED
         )
         
@@ -68,9 +76,12 @@ async def main() -> None:
             except asyncio.CancelledError:
                 pass
                 
-        for task in done:
-            if task == bot_task and task.exception():
-                raise task.exception()
+        if bots_task in done:
+            if bots_task.exception():
+                raise bots_task.exception()
+            if not guard.bots:
+                logger.error("All personas were shed over the memory budget")
+                sys.exit(1)
                 
     except asyncio.TimeoutError:
         logger.error("Bot operation timed out")
@@ -78,10 +89,11 @@ async def main() -> None:
     except asyncio.CancelledError:
         logger.info("Bot operation cancelled")
     except Exception as e:
-        logger.error(f"Bot error: {e}", exc_info=True)
+        logger.error("Bot error: %s", e, exc_info=True)
         sys.exit(1)
     finally:
         logger.info("Twitter Persona Bot stopped")
+        shutdown_logging()
 
 
 if __name__ == "__main__":
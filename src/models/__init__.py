@@ -1,5 +1,19 @@
 """Data models and types for the twitter persona bot."""
 
-from .types import Settings
+from .types import (
+    BudgetDecision,
+    ContextSnippet,
+    FeedResult,
+    Settings,
+    SimulationReport,
+    UsageRecord,
+)
 
-__all__ = ["Settings"]
\ No newline at end of file
+__all__ = [
+    "BudgetDecision",
+    "ContextSnippet",
+    "FeedResult",
+    "Settings",
+    "SimulationReport",
+    "UsageRecord",
+]
\ No newline at end of file
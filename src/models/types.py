@@ -1,9 +1,11 @@
 """Type definitions for the twitter persona bot system."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Application configuration settings."""
     
@@ -14,4 +16,93 @@ class Settings:
     twitter_access_token: str
     twitter_access_token_secret: str
     openai_api_key: str
-    openai_model: str = "gpt-4-turbo"
\ No newline at end of file
+    openai_model: str = "gpt-4-turbo"
+    persona_id: str = "default"
+    cassette_mode: str = ""
+    cassette_path: str = "cassettes/session.jsonl"
+    cassette_latency_scale: float = 1.0
+    data_dir: str = "data"
+    budget_usd: float = 0.0
+    budget_window_hours: float = 24.0
+    budget_fallback_model: str = "gpt-4o-mini"
+    model_prices: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    profile_enabled: bool = False
+    profile_sample_every: int = 0
+    context_feeds: List[str] = field(default_factory=list)
+    context_own_timeline: bool = False
+    context_keywords: List[str] = field(default_factory=list)
+    context_refresh_minutes: float = 30.0
+    context_ttl_hours: float = 24.0
+    context_top_k: int = 3
+    memory_budget_mb: int = 0
+    memory_compact: bool = False
+    
+    def __post_init__(self) -> None:
+        self.system_prompt = sys.intern(self.system_prompt)
+        self.openai_model = sys.intern(self.openai_model)
+        self.persona_id = sys.intern(self.persona_id)
+
+
+@dataclass(slots=True)
+class UsageRecord:
+    """Token usage of a single completion."""
+    
+    timestamp: float
+    persona_id: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    cost: float
+
+
+@dataclass(slots=True)
+class BudgetDecision:
+    """How the next completion should be generated."""
+    
+    model: str
+    max_tokens: int
+    skip: bool = False
+    reason: str = ""
+
+
+@dataclass(slots=True)
+class ContextSnippet:
+    """A piece of current context fetched from a feed or timeline."""
+    
+    id: str
+    source: str
+    text: str
+    url: str = ""
+    published: Optional[float] = None
+    fetched_at: float = 0.0
+
+
+@dataclass(slots=True)
+class FeedResult:
+    """Outcome of a conditional feed fetch."""
+    
+    not_modified: bool
+    snippets: List[ContextSnippet] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@dataclass(slots=True)
+class SimulationReport:
+    """Outcome of a fleet simulation."""
+    
+    personas: int
+    virtual_hours: float
+    wall_seconds: float
+    posts: int
+    failed_posts: int
+    throughput_per_hour: float
+    lag_p50: float
+    lag_p95: float
+    lag_max: float
+    queue_depth_mean: float
+    queue_depth_max: int
+    openai_collisions: int
+    user_collisions: int
+    app_collisions: int
+    peak_rss_mb: float
\ No newline at end of file
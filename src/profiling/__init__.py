@@ -0,0 +1,12 @@
+"""Opt-in profiling of post cycles.
+
+Each cycle records wall and CPU time per stage to a JSON lines file. Every
+``sample_every`` cycles a full ``cProfile`` dump and a tracemalloc snapshot
+are written next to it. Summarize the results with::
+
+    python -m src.profiling --dir data/profiles --top 10
+"""
+
+from .profiler import CycleProfiler, load_cycles, profile_stage, summarize
+
+__all__ = ["CycleProfiler", "load_cycles", "profile_stage", "summarize"]
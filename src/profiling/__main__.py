@@ -0,0 +1,23 @@
+"""Summarize profiled post cycles."""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .profiler import load_cycles, summarize
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print the slowest cycles and per-stage statistics."""
+    parser = argparse.ArgumentParser(description="Summarize profiled post cycles.")
+    parser.add_argument("--dir", default="data/profiles", help="profile output directory")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest cycles to show")
+    parser.add_argument("--persona", help="only include this persona")
+    args = parser.parse_args(argv)
+
+    print(summarize(load_cycles(args.dir, args.persona), args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
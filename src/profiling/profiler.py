@@ -0,0 +1,196 @@
+"""Per-stage timing of post cycles with sampled cProfile/tracemalloc snapshots."""
+
+import contextvars
+import cProfile
+import json
+import logging
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CYCLES_FILE = "cycles.jsonl"
+
+_active_cycle: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "active_cycle", default=None
+)
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """Time a stage of the active cycle.
+
+    Does nothing outside a profiled cycle. Stages entered repeatedly, such as
+    retried requests, accumulate their times and count. Nested stages are
+    recorded independently, so their times overlap with the enclosing stage.
+    CPU time is that of the calling thread, so work on the log writer and
+    context ingestion threads is not attributed to the stage.
+
+    Args:
+        name: Stage name
+    """
+    cycle = _active_cycle.get()
+    if cycle is None:
+        yield
+        return
+
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield
+    finally:
+        stage = cycle["stages"].setdefault(name, {"wall": 0.0, "cpu": 0.0, "count": 0})
+        stage["wall"] += time.perf_counter() - wall_start
+        stage["cpu"] += time.thread_time() - cpu_start
+        stage["count"] += 1
+
+
+class CycleProfiler:
+    """Records per-stage timings of post cycles."""
+
+    def __init__(self, output_dir: str, enabled: bool = False, sample_every: int = 0):
+        self.output_dir = Path(output_dir)
+        self.enabled = enabled
+        self.sample_every = sample_every
+        self.cycles = 0
+
+    @contextmanager
+    def cycle(self, persona_id: str, request_id: Optional[str] = None) -> Iterator[None]:
+        """Profile a post cycle.
+
+        Args:
+            persona_id: Persona running the cycle
+            request_id: Request ID correlating the cycle with its log records
+        """
+        if not self.enabled:
+            yield
+            return
+
+        self.cycles += 1
+        sampled = self.sample_every > 0 and self.cycles % self.sample_every == 0
+        record: Dict[str, Any] = {
+            "persona_id": persona_id,
+            "request_id": request_id,
+            "started": time.time(),
+            "stages": {},
+        }
+        token = _active_cycle.set(record)
+
+        profiler = None
+        started_tracing = False
+        if sampled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            record["wall"] = time.perf_counter() - wall_start
+            record["cpu"] = time.thread_time() - cpu_start
+            _active_cycle.reset(token)
+
+            if profiler:
+                profiler.disable()
+            self._write(record, profiler, sampled)
+            if started_tracing:
+                tracemalloc.stop()
+
+    def _write(
+        self,
+        record: Dict[str, Any],
+        profiler: Optional[cProfile.Profile],
+        sampled: bool
+    ) -> None:
+        """Persist a cycle record and its sampled snapshots."""
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            if sampled:
+                stem = f"cycle-{int(record['started'])}-{record['request_id'] or self.cycles}"
+                profiler.dump_stats(str(self.output_dir / f"{stem}.prof"))
+                tracemalloc.take_snapshot().dump(str(self.output_dir / f"{stem}.tracemalloc"))
+                record["snapshot"] = stem
+
+            with (self.output_dir / CYCLES_FILE).open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        except OSError as e:
+            logger.error("Failed to write profile: %s", e)
+
+
+def load_cycles(output_dir: str, persona_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Load recorded cycles.
+
+    Args:
+        output_dir: Directory the profiler wrote to
+        persona_id: Only load cycles of this persona
+
+    Returns:
+        Cycle records in recording order
+    """
+    path = Path(output_dir) / CYCLES_FILE
+    if not path.exists():
+        return []
+
+    cycles = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                cycle = json.loads(line)
+                if persona_id is None or cycle["persona_id"] == persona_id:
+                    cycles.append(cycle)
+    return cycles
+
+
+def summarize(cycles: List[Dict[str, Any]], top: int = 10) -> str:
+    """Render the slowest cycles and per-stage statistics.
+
+    Args:
+        cycles: Cycle records
+        top: Number of slowest cycles to list
+
+    Returns:
+        Human-readable report
+    """
+    if not cycles:
+        return "No profiled cycles found."
+
+    lines = [f"Slowest {min(top, len(cycles))} of {len(cycles)} cycles:"]
+    for cycle in sorted(cycles, key=lambda c: c["wall"], reverse=True)[:top]:
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(cycle["started"]))
+        lines.append(
+            f"  {started}  {cycle['persona_id']}  {cycle['request_id'] or '-'}  "
+            f"wall={cycle['wall'] * 1000:.1f}ms cpu={cycle['cpu'] * 1000:.1f}ms"
+            + (f"  snapshot={cycle['snapshot']}" if cycle.get("snapshot") else "")
+        )
+        stages = sorted(cycle["stages"].items(), key=lambda s: s[1]["wall"], reverse=True)
+        for name, stage in stages:
+            lines.append(
+                f"      {name:<20} wall={stage['wall'] * 1000:.1f}ms "
+                f"cpu={stage['cpu'] * 1000:.1f}ms x{stage['count']}"
+            )
+
+    walls: Dict[str, List[float]] = {}
+    for cycle in cycles:
+        for name, stage in cycle["stages"].items():
+            walls.setdefault(name, []).append(stage["wall"])
+
+    lines.append("")
+    lines.append("Stage wall time (ms):")
+    lines.append(f"  {'stage':<20} {'n':>5} {'p50':>9} {'p95':>9} {'max':>9}")
+    for name, values in sorted(walls.items()):
+        values.sort()
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        lines.append(
+            f"  {name:<20} {len(values):>5} {statistics.median(values) * 1000:>9.1f} "
+            f"{p95 * 1000:>9.1f} {values[-1] * 1000:>9.1f}"
+        )
+
+    return "\n".join(lines)
@@ -0,0 +1,14 @@
+"""Fleet-scale load simulation in accelerated virtual time.
+
+Runs many personas with the real scheduler and post path against
+in-process fakes, for example a week of 50 personas::
+
+    python -m src.simulation --personas 50 --days 7
+"""
+
+from src.models.types import SimulationReport
+
+from .clock import VirtualClock
+from .runner import FleetSimulation, format_report
+
+__all__ = ["FleetSimulation", "SimulationReport", "VirtualClock", "format_report"]
@@ -0,0 +1,49 @@
+"""Simulate fleet-scale posting schedules in accelerated virtual time."""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from typing import List, Optional
+
+from src.config.log import configure_logging
+
+from .runner import FleetSimulation, format_report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a simulation and print its report."""
+    parser = argparse.ArgumentParser(description="Simulate multi-persona posting in virtual time.")
+    parser.add_argument("--personas", type=int, default=50, help="number of personas")
+    parser.add_argument("--days", type=float, default=7.0, help="virtual days to simulate")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for latencies")
+    parser.add_argument("--openai-latency", type=float, default=1.5, help="mean OpenAI latency in seconds")
+    parser.add_argument("--twitter-latency", type=float, default=0.4, help="mean Twitter latency in seconds")
+    parser.add_argument("--openai-rpm", type=int, default=0, help="OpenAI requests per minute, 0 for unlimited")
+    parser.add_argument("--user-limit", type=int, default=0, help="posts per account per 24h, 0 for unlimited")
+    parser.add_argument("--app-limit", type=int, default=0, help="posts per app per 24h, 0 for unlimited")
+    parser.add_argument("--stagger", type=float, default=1.0, help="seconds between persona start times")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--log-level", default="CRITICAL", help="log level of the simulated bots")
+    args = parser.parse_args(argv)
+
+    configure_logging(level=args.log_level, use_queue=True)
+
+    report = FleetSimulation(
+        personas=args.personas,
+        days=args.days,
+        seed=args.seed,
+        openai_latency=args.openai_latency,
+        twitter_latency=args.twitter_latency,
+        openai_rpm=args.openai_rpm,
+        user_daily_limit=args.user_limit,
+        app_daily_limit=args.app_limit,
+        stagger_seconds=args.stagger
+    ).run()
+
+    print(json.dumps(asdict(report), indent=2) if args.json else format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
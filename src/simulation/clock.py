@@ -0,0 +1,61 @@
+"""Virtual clock for accelerated simulations."""
+
+import datetime
+import types
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import schedule
+
+
+class VirtualClock:
+    """Monotonic clock that only moves when advanced."""
+
+    def __init__(self, start: Optional[datetime.datetime] = None):
+        self.now = start or datetime.datetime(2025, 1, 6, 0, 0, 0)
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward.
+
+        Args:
+            seconds: Virtual seconds to advance
+        """
+        self.now += datetime.timedelta(seconds=seconds)
+
+    def advance_to(self, moment: datetime.datetime) -> None:
+        """Move the clock forward to a moment, never backwards.
+
+        Args:
+            moment: Target time
+        """
+        if moment > self.now:
+            self.now = moment
+
+    @contextmanager
+    def installed(self) -> Iterator["VirtualClock"]:
+        """Make the ``schedule`` library read time from this clock.
+
+        ``schedule`` calls ``datetime.datetime.now()`` through its module
+        global, so swapping that global for a copy of the ``datetime`` module
+        with a clock-backed ``datetime`` class drives real ``Scheduler``
+        instances in virtual time without touching the real module.
+        """
+        clock = self
+
+        class VirtualDatetime(datetime.datetime):
+            @classmethod
+            def now(cls, tz: Optional[datetime.tzinfo] = None) -> datetime.datetime:
+                if tz is not None:
+                    return clock.now.replace(tzinfo=tz)
+                return clock.now
+
+        shim = types.ModuleType("datetime")
+        shim.__dict__.update(datetime.__dict__)
+        shim.datetime = VirtualDatetime
+
+        original = schedule.datetime
+        schedule.datetime = shim
+        try:
+            yield self
+        finally:
+            schedule.datetime = original
@@ -0,0 +1,131 @@
+"""In-process stand-ins for the OpenAI and Twitter SDK clients."""
+
+import random
+from collections import deque
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, Deque, Dict
+
+from .clock import VirtualClock
+
+DAY = timedelta(days=1)
+MINUTE = timedelta(minutes=1)
+
+
+class SimulationStats:
+    """Counters shared by the fakes of one simulation."""
+
+    def __init__(self):
+        self.completions = 0
+        self.posts = 0
+        self.openai_collisions = 0
+        self.user_collisions = 0
+        self.app_collisions = 0
+
+
+class FakeOpenAI:
+    """Replaces ``OpenAI`` for ``OpenAIClient``, advancing the virtual clock.
+
+    Requests beyond ``rpm_limit`` in a rolling minute count as collisions and
+    wait in virtual time until the window frees up, the way a client backing
+    off on 429 responses would.
+    """
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        stats: SimulationStats,
+        rng: random.Random,
+        latency: float = 1.5,
+        rpm_limit: int = 0
+    ):
+        self.clock = clock
+        self.stats = stats
+        self.rng = rng
+        self.latency = latency
+        self.rpm_limit = rpm_limit
+        self._recent: Deque = deque()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs: Any) -> Any:
+        if self.rpm_limit:
+            while self._recent and self._recent[0] <= self.clock.now - MINUTE:
+                self._recent.popleft()
+            if len(self._recent) >= self.rpm_limit:
+                self.stats.openai_collisions += 1
+                self.clock.advance_to(self._recent[0] + MINUTE)
+                self._recent.popleft()
+            self._recent.append(self.clock.now)
+
+        self.clock.advance(self.latency * self.rng.uniform(0.5, 1.5))
+        self.stats.completions += 1
+        prompt_tokens = sum(len(m["content"]) for m in kwargs["messages"]) // 4
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(
+                content=f"Simulated tweet {self.stats.completions}"
+            ))],
+            usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=30)
+        )
+
+
+class FakeTwitterApp:
+    """Twitter app shared by all simulated accounts, enforcing post limits.
+
+    ``user_daily_limit`` applies per account and ``app_daily_limit`` across
+    all accounts, both over a rolling 24 hours. Rejected posts count as
+    rate-limit collisions.
+    """
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        stats: SimulationStats,
+        rng: random.Random,
+        latency: float = 0.4,
+        user_daily_limit: int = 0,
+        app_daily_limit: int = 0
+    ):
+        self.clock = clock
+        self.stats = stats
+        self.rng = rng
+        self.latency = latency
+        self.user_daily_limit = user_daily_limit
+        self.app_daily_limit = app_daily_limit
+        self._app_posts: Deque = deque()
+        self._user_posts: Dict[str, Deque] = {}
+
+    def client(self, account: str) -> "FakeTwitterClient":
+        """Create a tweepy ``Client`` stand-in for an account."""
+        return FakeTwitterClient(self, account)
+
+    def create_tweet(self, account: str, text: str) -> Any:
+        """Post a tweet for an account."""
+        self.clock.advance(self.latency * self.rng.uniform(0.5, 1.5))
+        cutoff = self.clock.now - DAY
+        user_posts = self._user_posts.setdefault(account, deque())
+        for posts in (self._app_posts, user_posts):
+            while posts and posts[0] <= cutoff:
+                posts.popleft()
+
+        if self.user_daily_limit and len(user_posts) >= self.user_daily_limit:
+            self.stats.user_collisions += 1
+            raise Exception("429 Too Many Requests: user post limit")
+        if self.app_daily_limit and len(self._app_posts) >= self.app_daily_limit:
+            self.stats.app_collisions += 1
+            raise Exception("429 Too Many Requests: app post limit")
+
+        user_posts.append(self.clock.now)
+        self._app_posts.append(self.clock.now)
+        self.stats.posts += 1
+        return SimpleNamespace(data={"id": str(self.stats.posts), "text": text})
+
+
+class FakeTwitterClient:
+    """Replaces the tweepy ``Client`` of one ``TwitterClient``."""
+
+    def __init__(self, app: FakeTwitterApp, account: str):
+        self.app = app
+        self.account = account
+
+    def create_tweet(self, text: str) -> Any:
+        return self.app.create_tweet(self.account, text)
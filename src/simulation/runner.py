@@ -0,0 +1,170 @@
+"""Fleet-scale schedule simulation in virtual time."""
+
+import heapq
+import logging
+import random
+import statistics
+import tempfile
+import time
+from datetime import timedelta
+from typing import List
+
+from src.core.memory import MB, current_rss
+from src.core.persona_bot import PersonaBot
+from src.models.types import Settings, SimulationReport
+
+from .clock import VirtualClock
+from .fakes import FakeOpenAI, FakeTwitterApp, SimulationStats
+
+logger = logging.getLogger(__name__)
+
+
+class FleetSimulation:
+    """Runs many ``PersonaBot`` schedules against fakes on a virtual clock.
+
+    Every bot gets the real ``TweetScheduler`` and post path, with the SDK
+    clients swapped for in-process fakes that advance the clock by their
+    latency. Bots are woken the way ``PersonaBot.run`` polls, and because
+    ``post_tweet`` is synchronous, a slow post delays every bot waiting on
+    the same event loop, just as it does in production.
+
+    Limitations:
+
+    - The polling loop of ``PersonaBot.run`` is re-implemented here rather
+      than driven, so changes to that loop are not simulated.
+    - The virtual clock is only installed into ``schedule``. ``UsageLedger``,
+      ``BudgetPolicy`` and the context cache TTL read ``time.time()``, so
+      budget windows and cache expiry do not advance during a simulated run.
+    """
+
+    def __init__(
+        self,
+        personas: int,
+        days: float = 7.0,
+        seed: int = 0,
+        openai_latency: float = 1.5,
+        twitter_latency: float = 0.4,
+        openai_rpm: int = 0,
+        user_daily_limit: int = 0,
+        app_daily_limit: int = 0,
+        stagger_seconds: float = 1.0
+    ):
+        self.personas = personas
+        self.days = days
+        self.stagger_seconds = stagger_seconds
+        self.clock = VirtualClock()
+        self.stats = SimulationStats()
+        rng = random.Random(seed)
+        self.openai = FakeOpenAI(
+            self.clock, self.stats, rng, latency=openai_latency, rpm_limit=openai_rpm
+        )
+        self.twitter = FakeTwitterApp(
+            self.clock, self.stats, rng, latency=twitter_latency,
+            user_daily_limit=user_daily_limit, app_daily_limit=app_daily_limit
+        )
+
+    def _create_bot(self, index: int, data_dir: str) -> PersonaBot:
+        """Create a bot wired to the fakes."""
+        persona_id = f"persona-{index:04d}"
+        settings = Settings(
+            system_prompt="You are a simulated persona posting about technology.",
+            twitter_bearer_token="simulated",
+            twitter_api_key="simulated",
+            twitter_api_secret="simulated",
+            twitter_access_token=persona_id,
+            twitter_access_token_secret="simulated",
+            openai_api_key="simulated",
+            openai_model="gpt-4o-mini",
+            persona_id=persona_id,
+            data_dir=data_dir,
+            memory_compact=True
+        )
+        bot = PersonaBot(settings)
+        bot.openai_client.client = self.openai
+        bot.twitter_client._client = self.twitter.client(persona_id)
+        bot.twitter_client._username = persona_id
+        return bot
+
+    def run(self) -> SimulationReport:
+        """Run the simulation to completion."""
+        wall_start = time.perf_counter()
+        start = self.clock.now
+        end = start + timedelta(days=self.days)
+        poll = timedelta(seconds=PersonaBot.POLL_INTERVAL_SECONDS)
+
+        with tempfile.TemporaryDirectory() as data_dir, self.clock.installed():
+            bots = [self._create_bot(i, data_dir) for i in range(self.personas)]
+            peak_rss = current_rss()
+            wakeups = [
+                (start + timedelta(seconds=i * self.stagger_seconds), i)
+                for i in range(self.personas)
+            ]
+            heapq.heapify(wakeups)
+
+            lags: List[float] = []
+            depths: List[int] = []
+            attempts = 0
+            next_sample = start
+
+            while wakeups and wakeups[0][0] < end:
+                wake, index = heapq.heappop(wakeups)
+                self.clock.advance_to(wake)
+                bot = bots[index]
+
+                if self.clock.now >= next_sample:
+                    depths.append(sum(b.scheduler.pending_count() for b in bots if b.running))
+                    peak_rss = max(peak_rss, current_rss())
+                    next_sample = self.clock.now + poll
+
+                if not bot.running:
+                    bot.running = True
+                    attempts += 1
+                    bot.post_tweet()
+                    bot.scheduler.schedule_tweets(bot.post_tweet)
+                else:
+                    due = bot.scheduler.next_run
+                    if due is not None and due <= self.clock.now:
+                        lags.append((self.clock.now - due).total_seconds())
+                        attempts += 1
+                    bot.scheduler.run_pending()
+
+                heapq.heappush(wakeups, (self.clock.now + poll, index))
+
+            peak_rss = max(peak_rss, current_rss())
+
+        virtual_hours = (max(self.clock.now, end) - start).total_seconds() / 3600
+        lags.sort()
+        return SimulationReport(
+            personas=self.personas,
+            virtual_hours=virtual_hours,
+            wall_seconds=time.perf_counter() - wall_start,
+            posts=self.stats.posts,
+            failed_posts=attempts - self.stats.posts,
+            throughput_per_hour=self.stats.posts / virtual_hours if virtual_hours else 0.0,
+            lag_p50=statistics.median(lags) if lags else 0.0,
+            lag_p95=lags[min(len(lags) - 1, int(len(lags) * 0.95))] if lags else 0.0,
+            lag_max=lags[-1] if lags else 0.0,
+            queue_depth_mean=statistics.fmean(depths) if depths else 0.0,
+            queue_depth_max=max(depths, default=0),
+            openai_collisions=self.stats.openai_collisions,
+            user_collisions=self.stats.user_collisions,
+            app_collisions=self.stats.app_collisions,
+            peak_rss_mb=peak_rss / MB
+        )
+
+
+def format_report(report: SimulationReport) -> str:
+    """Render a simulation report."""
+    speedup = report.virtual_hours * 3600 / report.wall_seconds if report.wall_seconds else 0.0
+    return "\n".join([
+        f"Simulated {report.virtual_hours / 24:.1f} days of {report.personas} personas "
+        f"in {report.wall_seconds:.1f}s ({speedup:,.0f}x real time)",
+        f"Posts:           {report.posts} ok, {report.failed_posts} failed, "
+        f"{report.throughput_per_hour:.1f}/hour",
+        f"Schedule lag:    p50 {report.lag_p50:.1f}s, p95 {report.lag_p95:.1f}s, "
+        f"max {report.lag_max:.1f}s",
+        f"Queue depth:     mean {report.queue_depth_mean:.2f}, max {report.queue_depth_max}",
+        f"Rate limits:     {report.openai_collisions} OpenAI RPM, "
+        f"{report.user_collisions} per-user, {report.app_collisions} per-app collisions",
+        f"Peak RSS:        {report.peak_rss_mb:.1f} MB",
+    ])
@@ -1,9 +1,12 @@
 """Core bot functionality tests."""
 
 import asyncio
+import json
+import os
 from unittest.mock import Mock, patch
 import pytest
 
+from src.config import load_personas
 from src.core.persona_bot import PersonaBot
 from src.models.types import Settings
 
@@ -99,4 +102,34 @@ class TestPersonaBot:
                     pass
                 
                 mock_scheduler.schedule_tweets.assert_called_once()
-                mock_post_tweet.assert_called_once()
\ No newline at end of file
+                mock_post_tweet.assert_called_once()    
+    def test_load_personas(self, monkeypatch):
+        """Test PERSONAS runs several personas over shared settings."""
+        for var, value in {
+            "SYSTEM_PROMPT": "Shared persona",
+            "TWITTER_BEARER_TOKEN": "bearer",
+            "TWITTER_API_KEY": "key",
+            "TWITTER_API_SECRET": "secret",
+            "TWITTER_ACCESS_TOKEN": "access",
+            "TWITTER_ACCESS_TOKEN_SECRET": "access_secret",
+            "OPENAI_API_KEY": "openai_key",
+            "DATA_DIR": "/data",
+        }.items():
+            monkeypatch.setenv(var, value)
+        
+        monkeypatch.delenv("PERSONAS", raising=False)
+        assert [s.persona_id for s in load_personas()] == ["default"]
+        
+        monkeypatch.setenv("PERSONAS", json.dumps([
+            {"persona_id": "alice", "twitter_access_token": "alice_token"},
+            {"persona_id": "bob", "system_prompt": "Bob persona"},
+        ]))
+        alice, bob = load_personas()
+        
+        assert (alice.twitter_access_token, alice.system_prompt) == ("alice_token", "Shared persona")
+        assert (bob.twitter_access_token, bob.system_prompt) == ("access", "Bob persona")
+        assert bob.data_dir == os.path.join("/data", "bob")
+        
+        monkeypatch.setenv("PERSONAS", json.dumps([{"persona_id": "a"}, {"persona_id": "a"}]))
+        with pytest.raises(ValueError, match="distinct"):
+            load_personas()
@@ -0,0 +1,86 @@
+"""Token accounting and budget tests."""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.clients.openai import OpenAIClient
+from src.core.budget import BudgetPolicy, UsageLedger, estimate_cost, model_price
+
+
+class TestBudget:
+    """Test usage accounting and budget throttling."""
+
+    def test_ledger_persists_and_aggregates(self, tmp_path):
+        """Test usage is aggregated per model and reloaded from disk."""
+        path = tmp_path / "usage.jsonl"
+        ledger = UsageLedger(str(path), window_seconds=3600)
+        now = time.time()
+
+        ledger.record("alice", "gpt-4o", 1000, 100, timestamp=now - 7200)
+        ledger.record("alice", "gpt-4o", 1000, 100, timestamp=now)
+        ledger.record("alice", "gpt-4o-mini", 500, 50, timestamp=now)
+        ledger.record("bob", "gpt-4o", 1000, 100, timestamp=now)
+
+        totals = UsageLedger(str(path), window_seconds=3600).totals("alice")
+
+        assert set(totals) == {"gpt-4o", "gpt-4o-mini"}
+        assert totals["gpt-4o"]["prompt_tokens"] == 1000
+        assert totals["gpt-4o"]["cost"] == pytest.approx(estimate_cost("gpt-4o", 1000, 100))
+        assert len(path.read_text().splitlines()) == 4
+
+    def test_policy_downgrades_then_skips(self, tmp_path):
+        """Test throttling escalates as spend approaches the budget."""
+        ledger = UsageLedger(str(tmp_path / "usage.jsonl"))
+        policy = BudgetPolicy(ledger, budget_usd=1.0, soft_ratio=0.8)
+
+        decision = policy.plan("alice", "gpt-4-turbo", 100)
+        assert (decision.model, decision.max_tokens, decision.skip) == ("gpt-4-turbo", 100, False)
+
+        ledger.record("alice", "gpt-4-turbo", 85000, 0)
+        decision = policy.plan("alice", "gpt-4-turbo", 100)
+        assert (decision.model, decision.max_tokens, decision.skip) == ("gpt-4o-mini", 60, False)
+
+        ledger.record("alice", "gpt-4-turbo", 20000, 0)
+        assert policy.plan("alice", "gpt-4-turbo", 100).skip
+        assert not policy.plan("bob", "gpt-4-turbo", 100).skip
+
+    def test_client_reports_usage(self):
+        """Test completions report token usage for the model used."""
+        callback = Mock()
+        client = OpenAIClient(api_key="key", model="gpt-4o", usage_callback=callback)
+        client.client = Mock()
+        client.client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Tweet"))],
+            usage=SimpleNamespace(prompt_tokens=40, completion_tokens=12)
+        )
+
+        assert client.generate_tweet("prompt", model="gpt-4o-mini", max_tokens=60) == "Tweet"
+        callback.assert_called_once_with("gpt-4o-mini", 40, 12)
+        assert client.client.chat.completions.create.call_args.kwargs["max_tokens"] == 60
+
+    def test_prices_match_model_family_and_overrides(self, tmp_path):
+        """Test snapshots are priced by family and configured prices apply."""
+        assert model_price("gpt-4o-2024-08-06") == model_price("gpt-4o")
+        assert model_price("gpt-4o-mini-2024-07-18") == model_price("gpt-4o-mini")
+        assert model_price("gpt-4.1") != model_price("gpt-4")
+        assert model_price("custom-model") is None
+
+        ledger = UsageLedger(str(tmp_path / "usage.jsonl"), prices={"custom-model": (1.0, 2.0)})
+        record = ledger.record("alice", "custom-model-v2", 1_000_000, 1_000_000)
+        assert record.cost == pytest.approx(3.0)
+
+    def test_policy_rejects_unpriced_model(self, tmp_path):
+        """Test a budget cannot silently treat an unknown model as free."""
+        ledger = UsageLedger(str(tmp_path / "usage.jsonl"))
+
+        with pytest.raises(ValueError, match="custom-model"):
+            BudgetPolicy(ledger, budget_usd=0.01).validate_model("custom-model")
+        BudgetPolicy(ledger, budget_usd=0).validate_model("custom-model")
+
+        policy = BudgetPolicy(ledger, budget_usd=0.01)
+        policy.validate_model("gpt-4.1")
+        ledger.record("alice", "gpt-4.1", 0, 200_000)
+        assert policy.plan("alice", "gpt-4.1", 100).skip
@@ -0,0 +1,125 @@
+"""Record/replay cassette tests."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.clients.cassette import Cassette, CassetteError, CassetteOpenAI, CassetteTwitterClient
+from src.clients.openai import OpenAIClient
+from src.clients.twitter import TwitterClient
+
+
+def create_completion(content):
+    """Create a chat completion response."""
+    return SimpleNamespace(
+        model="gpt-4o-mini",
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(prompt_tokens=12, completion_tokens=8, total_tokens=20)
+    )
+
+
+class TestCassette:
+    """Test recording and replaying API traffic."""
+
+    def test_openai_record_and_replay(self, tmp_path):
+        """Test a recorded completion is served back offline."""
+        path = tmp_path / "session.jsonl"
+
+        cassette = Cassette(str(path), "record")
+        live = Mock()
+        live.chat.completions.create.return_value = create_completion("Live tweet")
+        client = OpenAIClient(api_key="key")
+        client.client = CassetteOpenAI(live, cassette)
+        assert client.generate_tweet("prompt") == "Live tweet"
+        cassette.close()
+
+        cassette = Cassette(str(path), "replay", latency_scale=0)
+        client = OpenAIClient(api_key="key", cassette=cassette)
+        response = client.client.chat.completions.create(model="gpt-4o-mini", messages=[])
+
+        assert response.choices[0].message.content == "Live tweet"
+        assert response.usage.total_tokens == 20
+        with pytest.raises(CassetteError):
+            client.client.chat.completions.create(model="gpt-4o-mini", messages=[])
+
+    def test_replay_prefers_matching_request(self, tmp_path):
+        """Test replay matches on request before falling back to order."""
+        path = tmp_path / "session.jsonl"
+        cassette = Cassette(str(path), "record")
+        for text in ("first", "second"):
+            cassette.call("twitter.create_tweet", {"text": text}, lambda: text, lambda r: {"data": {"id": r}})
+        cassette.close()
+
+        cassette = Cassette(str(path), "replay", latency_scale=0)
+
+        assert cassette.call("twitter.create_tweet", {"text": "second"}, None, None) == {"data": {"id": "second"}}
+        assert cassette.call("twitter.create_tweet", {"text": "other"}, None, None) == {"data": {"id": "first"}}
+
+    def test_twitter_replays_recorded_errors(self, tmp_path):
+        """Test recorded errors are raised again and handled by the client."""
+        path = tmp_path / "session.jsonl"
+        cassette = Cassette(str(path), "record")
+        live = Mock(side_effect=Exception("Too Many Requests"))
+        with pytest.raises(Exception):
+            cassette.call("twitter.create_tweet", {"text": "hi"}, live, None)
+        cassette.close()
+
+        cassette = Cassette(str(path), "replay", latency_scale=0)
+        twitter = TwitterClient("key", "secret", "access", "access_secret", cassette=cassette)
+        twitter._client = CassetteTwitterClient(Mock(), cassette)
+
+        assert twitter.post_tweet("hi") is None
+        with pytest.raises(CassetteError):
+            cassette.call("twitter.create_tweet", {"text": "hi"}, None, None)
+
+    def test_record_appends_to_existing_cassette(self, tmp_path):
+        """Test restarting a recording keeps earlier interactions."""
+        path = tmp_path / "session.jsonl"
+        for text in ("before restart", "after restart"):
+            cassette = Cassette(str(path), "record")
+            cassette.call("twitter.create_tweet", {"text": text}, lambda: text, lambda r: {"data": {"id": r}})
+            cassette.close()
+
+        cassette = Cassette(str(path), "replay", latency_scale=0)
+
+        assert cassette.call("twitter.create_tweet", {"text": "before restart"}, None, None) == {"data": {"id": "before restart"}}
+        assert cassette.call("twitter.create_tweet", {"text": "after restart"}, None, None) == {"data": {"id": "after restart"}}
+
+    def test_twitter_client_replays_offline(self, tmp_path):
+        """Test the Twitter client connects and posts from a cassette."""
+        path = tmp_path / "session.jsonl"
+        path.write_text(
+            '{"channel":"twitter.verify_credentials","key":"","request":{},'
+            '"response":{"screen_name":"bot"},"error":null,"elapsed":0.2}\n'
+            '{"channel":"twitter.create_tweet","key":"","request":{"text":"hi"},'
+            '"response":{"data":{"id":"42"}},"error":null,"elapsed":0.3}\n'
+        )
+        cassette = Cassette(str(path), "replay", latency_scale=0)
+        twitter = TwitterClient("key", "secret", "access", "access_secret", cassette=cassette)
+
+        twitter.connect()
+
+        assert twitter._username == "bot"
+        assert twitter.post_tweet("hi") == "42"
+
+    def test_invalid_mode(self, tmp_path):
+        """Test unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            Cassette(str(tmp_path / "session.jsonl"), "live")
+
+    def test_replayed_retries_scale_backoff(self, tmp_path):
+        """Test retry backoff after replayed errors follows the latency scale."""
+        path = tmp_path / "session.jsonl"
+        cassette = Cassette(str(path), "record")
+        for _ in range(3):
+            with pytest.raises(Exception):
+                cassette.call("openai.chat.completions.create", {}, Mock(side_effect=Exception("Rate limit")), None)
+        cassette.close()
+
+        cassette = Cassette(str(path), "replay", latency_scale=0)
+        client = OpenAIClient(api_key="key", cassette=cassette)
+
+        with patch("src.clients.cassette.time.sleep") as sleep:
+            assert client.generate_tweet("prompt") is None
+        sleep.assert_not_called()
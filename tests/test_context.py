@@ -0,0 +1,130 @@
+"""Context ingestion and cache tests."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.clients.feeds import FeedClient, parse_feed
+from src.clients.openai import OpenAIClient
+from src.core.context import ContextCache, ContextIngestor
+from src.core.tweet_generator import TweetGenerator
+from src.models.types import ContextSnippet, Settings
+
+RSS_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <item><guid>1</guid><title>New AI model released</title>
+    <description>&lt;p&gt;Benchmarks look strong&lt;/p&gt;</description>
+    <link>https://example.com/1</link></item>
+  <item><guid>2</guid><title>Local bakery opens</title></item>
+</channel></rss>"""
+
+
+def create_snippet(snippet_id, text, age=0.0):
+    """Create a context snippet fetched age seconds ago."""
+    return ContextSnippet(id=snippet_id, source="test", text=text, fetched_at=time.time() - age)
+
+
+class TestContext:
+    """Test context ingestion and retrieval."""
+
+    def test_parse_feeds(self):
+        """Test RSS, Atom and JSON feeds are parsed into snippets."""
+        rss = parse_feed("rss", RSS_FEED)
+        atom = parse_feed("atom", b"""<feed xmlns="http://www.w3.org/2005/Atom">
+            <entry><id>a</id><title>Atom entry</title><link href="https://example.com/a"/></entry>
+        </feed>""")
+        json_feed = parse_feed("json", b'{"items": [{"id": "j", "title": "JSON item", "url": "u"}]}')
+
+        assert rss[0].text == "New AI model released - Benchmarks look strong"
+        assert rss[0].url == "https://example.com/1"
+        assert len(rss) == 2
+        assert atom[0].text == "Atom entry"
+        assert atom[0].url == "https://example.com/a"
+        assert json_feed[0].text == "JSON item"
+
+    def test_conditional_requests(self, tmp_path):
+        """Test validators are sent back and unchanged feeds are skipped."""
+        feed_client = FeedClient()
+        feed_client.session = Mock()
+        feed_client.session.get.side_effect = [
+            Mock(status_code=200, iter_content=Mock(return_value=[RSS_FEED]), headers={"ETag": '"v1"'}),
+            Mock(status_code=304, headers={}),
+        ]
+        cache = ContextCache(str(tmp_path / "cache.jsonl"), keywords=["AI models"])
+        ingestor = ContextIngestor(cache, ["https://example.com/feed"], feed_client=feed_client)
+
+        assert ingestor.refresh() == 2
+        assert ingestor.refresh() == 0
+
+        second_headers = feed_client.session.get.call_args_list[1].kwargs["headers"]
+        assert second_headers == {"If-None-Match": '"v1"'}
+        assert ContextCache(str(tmp_path / "cache.jsonl"), keywords=[]).sources == {
+            "https://example.com/feed": {"etag": '"v1"', "last_modified": None}
+        }
+
+    def test_top_snippets_ranked_by_relevance(self, tmp_path):
+        """Test top-k prefers keyword matches, then recency, and skips expired ones."""
+        cache = ContextCache(str(tmp_path / "cache.jsonl"), keywords=["AI and programming"], ttl_seconds=3600)
+        cache.add([
+            create_snippet("old", "AI news from yesterday", age=7200),
+            create_snippet("ai", "AI conference announced", age=60),
+            create_snippet("both", "AI programming tools trend", age=120),
+            create_snippet("off", "Weather is sunny"),
+        ])
+
+        assert [s.id for s in cache.top(5)] == ["both", "ai"]
+        assert len(ContextCache(str(tmp_path / "cache.jsonl"), keywords=["AI"])) == 3
+
+    def test_prompt_includes_context(self, tmp_path):
+        """Test the prompt builder injects cached snippets."""
+        settings = Settings(
+            system_prompt="You love AI",
+            twitter_bearer_token="token",
+            twitter_api_key="key",
+            twitter_api_secret="secret",
+            twitter_access_token="access",
+            twitter_access_token_secret="access_secret",
+            openai_api_key="openai_key",
+            context_top_k=1
+        )
+        cache = ContextCache(str(tmp_path / "cache.jsonl"), keywords=[settings.system_prompt])
+        cache.add([create_snippet("1", "AI model released"), create_snippet("2", "AI chips shortage", age=10)])
+
+        generator = TweetGenerator(settings, Mock(spec=OpenAIClient), cache)
+        prompt = generator._build_prompt()
+
+        assert "- AI model released" in prompt
+        assert "AI chips shortage" not in prompt
+
+    def test_oversized_feed_rejected(self):
+        """Test feed bodies beyond the byte cap are refused while streaming."""
+        feed_client = FeedClient(max_bytes=100)
+        feed_client.session = Mock()
+        response = Mock(status_code=200, headers={}, iter_content=Mock(return_value=[b"x" * 64] * 4))
+        feed_client.session.get.return_value = response
+
+        with pytest.raises(ValueError, match="too large"):
+            feed_client.fetch("https://example.com/feed")
+        response.close.assert_called_once()
+
+    def test_cache_journal_appends_and_compacts(self, tmp_path):
+        """Test saves append only new entries and the journal is compacted."""
+        path = tmp_path / "cache.jsonl"
+        cache = ContextCache(str(path), keywords=[], max_snippets=5)
+        cache.COMPACT_SLACK = 4
+        cache.add([create_snippet("1", "First"), create_snippet("2", "Second")])
+        cache.sources["feed"] = {"etag": '"v1"'}
+        cache.save()
+        cache.add([create_snippet("3", "Third")])
+
+        assert len(path.read_text().splitlines()) == 4
+        assert len(ContextCache(str(path), keywords=[])) == 3
+
+        for i in range(4, 40):
+            cache.add([create_snippet(str(i), f"Item {i}")])
+
+        assert len(path.read_text().splitlines()) <= 2 * 5 + cache.COMPACT_SLACK
+        reloaded = ContextCache(str(path), keywords=[], max_snippets=5)
+        assert len(reloaded) == 5
+        assert reloaded.sources == {"feed": {"etag": '"v1"'}}
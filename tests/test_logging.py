@@ -0,0 +1,100 @@
+"""Logging pipeline tests."""
+
+import json
+import logging
+import queue
+import time
+
+from src.config.log import (
+    ContextFilter,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    SamplingQueueListener,
+    log_context,
+)
+
+
+def create_record(msg, *args, level=logging.ERROR, created=1000.0):
+    """Create a log record."""
+    record = logging.LogRecord("test", level, __file__, 1, msg, args, None)
+    record.created = created
+    return record
+
+
+class TestLogging:
+    """Test the structured logging pipeline."""
+
+    def test_json_record_carries_context_ids(self):
+        """Test JSON records include the persona and request IDs."""
+        record = create_record("Generated tweet: %s", "hello", level=logging.INFO)
+
+        with log_context(persona_id="alice", request_id="abc123"):
+            ContextFilter().filter(record)
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        assert entry["msg"] == "Generated tweet: hello"
+        assert entry["persona_id"] == "alice"
+        assert entry["request_id"] == "abc123"
+        assert entry["level"] == "INFO"
+
+    def test_queue_handler_defers_formatting(self):
+        """Test records are enqueued with their arguments unmerged."""
+        log_queue = queue.Queue(maxsize=1)
+        handler = NonBlockingQueueHandler(log_queue)
+
+        handler.handle(create_record("Error: %s", "boom"))
+        handler.handle(create_record("Error: %s", "dropped"))
+
+        queued = log_queue.get_nowait()
+        assert queued.msg == "Error: %s"
+        assert queued.args == ("boom",)
+        assert handler.dropped == 1
+
+    def test_sampling_suppresses_repetitive_errors(self):
+        """Test repetitive errors are sampled per window."""
+        sampler = SamplingFilter(window=60.0, burst=2)
+
+        passed = [
+            sampler.filter(create_record("OpenAI API error: %s", i, created=1000.0 + i))
+            for i in range(5)
+        ]
+        assert passed == [True, True, False, False, False]
+
+        assert sampler.filter(create_record("Other error", created=1001.0))
+        assert sampler.filter(create_record("Info", level=logging.INFO, created=1001.0))
+
+        record = create_record("OpenAI API error: %s", 99, created=1070.0)
+        assert sampler.filter(record)
+        assert record.suppressed == 3
+
+    def test_sampling_reports_suppressed_after_burst_stops(self):
+        """Test suppressed counts are logged even if no later record arrives."""
+        sampler = SamplingFilter(window=60.0, burst=1)
+        for i in range(4):
+            sampler.filter(create_record("OpenAI API error: %s", i, created=1000.0 + i))
+
+        assert sampler.flush(1030.0) == []
+        summary, = sampler.flush(1060.0)
+        assert summary.suppressed == 3
+        assert summary.getMessage() == "Suppressed 3 repetitive records: OpenAI API error: %s"
+        assert sampler.flush(1200.0) == []
+
+    def test_listener_flushes_suppressed_on_stop(self):
+        """Test stopping the listener reports counts of open windows."""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        sampler = SamplingFilter(window=3600.0, burst=1)
+        handler.addFilter(sampler)
+        log_queue = queue.Queue()
+        listener = SamplingQueueListener(log_queue, handler, sampler)
+
+        listener.start()
+        for i in range(3):
+            log_queue.put(create_record("Error: %s", i, created=time.time()))
+        listener.stop()
+        listener.flush_suppressed(force=True)
+
+        assert [getattr(record, "suppressed", 0) for record in records] == [0, 2]
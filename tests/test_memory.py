@@ -0,0 +1,156 @@
+"""Memory-bounded operation tests."""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+
+from src.core.history import TweetHistory
+from src.core.memory import MB, MemoryGuard
+from src.core.persona_bot import PersonaBot
+from src.models.types import Settings
+
+
+def create_bot(persona_id, footprint):
+    """Create a guarded bot stand-in."""
+    bot = SimpleNamespace(
+        settings=SimpleNamespace(persona_id=persona_id),
+        running=True,
+        paused=False,
+        memory_footprint=lambda: footprint
+    )
+    bot.release = lambda: setattr(bot, "running", False)
+    bot.pause = lambda: setattr(bot, "paused", True)
+    bot.resume = lambda: setattr(bot, "paused", False)
+    return bot
+
+
+def create_settings(data_dir):
+    """Create settings for a bot with context ingestion."""
+    return Settings(
+        system_prompt="Test persona",
+        twitter_bearer_token="token",
+        twitter_api_key="key",
+        twitter_api_secret="secret",
+        twitter_access_token="access",
+        twitter_access_token_secret="access_secret",
+        openai_api_key="openai_key",
+        data_dir=str(data_dir),
+        context_feeds=["https://example.com/feed"]
+    )
+
+
+class TestMemory:
+    """Test compact state and the memory budget guard."""
+
+    def test_history_ring_buffer(self):
+        """Test the history evicts the oldest tweets and decodes on access."""
+        history = TweetHistory(3)
+        for text in ["one", "two ✨", "three", "four"]:
+            history.append(text)
+
+        assert len(history) == 3
+        assert list(history) == ["two ✨", "three", "four"]
+        assert history[-1] == "four"
+        assert history[-2:] == ["three", "four"]
+        assert history.nbytes < 64
+
+    def test_settings_are_compact(self):
+        """Test settings use slots and intern the persona prompt."""
+        settings = Settings(
+            system_prompt="".join(["Shared ", "persona"]),
+            twitter_bearer_token="token",
+            twitter_api_key="key",
+            twitter_api_secret="secret",
+            twitter_access_token="access",
+            twitter_access_token_secret="access_secret",
+            openai_api_key="openai_key"
+        )
+
+        assert not hasattr(settings, "__dict__")
+        assert settings.system_prompt is sys.intern("Shared persona")
+
+    def test_guard_pauses_sheds_and_resumes(self):
+        """Test the guard escalates on the largest persona and recovers."""
+        guard = MemoryGuard(budget_mb=100, pause_cooldown_seconds=300)
+        small, large = create_bot("small", 1 * MB), create_bot("large", 5 * MB)
+        guard.register(small)
+        guard.register(large, baseline=2 * MB)
+
+        assert guard.attribution() == {"small": 1 * MB, "large": 7 * MB}
+        assert guard.check(rss=50 * MB, now=0) is None
+
+        assert guard.check(rss=90 * MB, now=0) == "large"
+        assert large.paused and large.running
+
+        assert guard.check(rss=90 * MB, now=30) is None
+        assert not small.paused
+
+        assert guard.check(rss=60 * MB, now=60) == "large"
+        assert not large.paused
+
+    def test_guard_sheds_largest_even_if_paused(self):
+        """Test the hard limit sheds the largest persona, not the largest active one."""
+        guard = MemoryGuard(budget_mb=100)
+        large, first, second = create_bot("large", 50 * MB), create_bot("a", MB), create_bot("b", MB)
+        for bot in (large, first, second):
+            guard.register(bot)
+
+        assert guard.check(rss=90 * MB, now=0) == "large"
+        assert guard.check(rss=97 * MB, now=30) == "large"
+
+        assert not large.running
+        assert first.running and second.running
+        assert guard.bots == [first, second]
+
+    def test_guard_never_pauses_last_active_persona(self):
+        """Test pausing is skipped when it would stop all posting."""
+        guard = MemoryGuard(budget_mb=100)
+        only = create_bot("only", MB)
+        guard.register(only)
+
+        assert guard.check(rss=90 * MB, now=0) is None
+        assert not only.paused
+
+        assert guard.check(rss=97 * MB, now=0) == "only"
+        assert not only.running and guard.bots == []
+
+    def test_pause_suspends_ingestion(self, tmp_path):
+        """Test a paused bot stops context ingestion and restarts it on resume."""
+        bot = PersonaBot(create_settings(tmp_path))
+
+        async def pause_and_resume():
+            bot.running = True
+            bot._start_ingestion()
+            task = bot._ingest_task
+            bot.pause()
+            await asyncio.sleep(0)
+            assert task.cancelled() and bot._ingest_task is None
+            bot.resume()
+            assert not bot.paused and bot._ingest_task is not None
+            bot.release()
+
+        asyncio.run(pause_and_resume())
+
+    def test_guard_disabled_without_budget(self):
+        """Test no action is taken without a budget."""
+        guard = MemoryGuard(budget_mb=0)
+        bot = create_bot("only", MB)
+        guard.register(bot)
+
+        assert guard.check(rss=10_000 * MB) is None
+        assert bot.running and not bot.paused
+
+    def test_release_drops_bot_state(self, tmp_path):
+        """Test a shed bot stops and lets go of its clients and caches."""
+        bot = PersonaBot(create_settings(tmp_path))
+        bot.running = True
+        bot.tweet_generator.tweet_history.append("Old tweet")
+        bot.scheduler.schedule_tweets(bot.post_tweet)
+
+        bot.release()
+
+        assert not bot.running
+        assert bot.twitter_client is None and bot.context_cache is None
+        assert bot.tweet_generator.context_cache is None
+        assert len(bot.tweet_generator.tweet_history) == 0
+        assert bot.scheduler.next_run is None
@@ -0,0 +1,83 @@
+"""Post cycle profiling tests."""
+
+import threading
+import time
+
+from src.profiling import CycleProfiler, load_cycles, profile_stage, summarize
+
+
+class TestProfiling:
+    """Test per-stage cycle profiling."""
+
+    def test_cycle_records_stages(self, tmp_path):
+        """Test stages are timed and repeated stages accumulate."""
+        profiler = CycleProfiler(str(tmp_path), enabled=True)
+
+        with profiler.cycle("alice", "req1"):
+            with profile_stage("openai.request"):
+                time.sleep(0.01)
+            with profile_stage("openai.request"):
+                pass
+            with profile_stage("twitter.post"):
+                pass
+
+        cycles = load_cycles(str(tmp_path))
+        assert len(cycles) == 1
+        stages = cycles[0]["stages"]
+        assert stages["openai.request"]["count"] == 2
+        assert stages["openai.request"]["wall"] >= 0.01
+        assert cycles[0]["wall"] >= stages["openai.request"]["wall"]
+        assert "snapshot" not in cycles[0]
+
+    def test_sampled_snapshots(self, tmp_path):
+        """Test cProfile and tracemalloc snapshots are written every N cycles."""
+        profiler = CycleProfiler(str(tmp_path), enabled=True, sample_every=2)
+
+        for i in range(4):
+            with profiler.cycle("alice", f"req{i}"):
+                pass
+
+        assert len(list(tmp_path.glob("*.prof"))) == 2
+        assert len(list(tmp_path.glob("*.tracemalloc"))) == 2
+        assert [c.get("snapshot") is not None for c in load_cycles(str(tmp_path))] == [
+            False, True, False, True
+        ]
+
+    def test_disabled_profiler_is_noop(self, tmp_path):
+        """Test nothing is recorded when profiling is off."""
+        profiler = CycleProfiler(str(tmp_path / "profiles"), enabled=False)
+
+        with profiler.cycle("alice"):
+            with profile_stage("generate"):
+                pass
+
+        assert not (tmp_path / "profiles").exists()
+
+    def test_summary_orders_slowest_cycles(self, tmp_path):
+        """Test the report lists the slowest cycles first."""
+        cycles = [
+            {"persona_id": "alice", "request_id": "fast", "started": 0, "wall": 0.1, "cpu": 0.01,
+             "stages": {"twitter.post": {"wall": 0.05, "cpu": 0.0, "count": 1}}},
+            {"persona_id": "bob", "request_id": "slow", "started": 0, "wall": 2.0, "cpu": 0.02,
+             "stages": {"openai.request": {"wall": 1.9, "cpu": 0.0, "count": 3}}},
+        ]
+
+        report = summarize(cycles, top=1)
+
+        assert "slow" in report
+        assert "fast" not in report
+        assert "openai.request" in report
+        assert "twitter.post" in report
+
+    def test_stage_cpu_excludes_other_threads(self, tmp_path):
+        """Test stage CPU time only counts the thread running the cycle."""
+        profiler = CycleProfiler(str(tmp_path), enabled=True)
+        busy = threading.Thread(target=lambda: sum(i * i for i in range(3_000_000)))
+
+        with profiler.cycle("alice"):
+            with profile_stage("twitter.post"):
+                busy.start()
+                busy.join()
+
+        cycle, = load_cycles(str(tmp_path))
+        assert cycle["stages"]["twitter.post"]["cpu"] < cycle["stages"]["twitter.post"]["wall"] / 2
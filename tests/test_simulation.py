@@ -0,0 +1,46 @@
+"""Fleet simulation tests."""
+
+import datetime
+
+import schedule
+
+from src.simulation import FleetSimulation, VirtualClock, format_report
+
+
+class TestSimulation:
+    """Test virtual-time fleet simulation."""
+
+    def test_clock_drives_scheduler(self):
+        """Test schedule reads virtual time only while the clock is installed."""
+        clock = VirtualClock()
+        scheduler = schedule.Scheduler()
+        runs = []
+
+        with clock.installed():
+            scheduler.every(1).hours.do(lambda: runs.append(clock.now))
+            clock.advance(3599)
+            scheduler.run_pending()
+            clock.advance(1)
+            scheduler.run_pending()
+
+        assert runs == [datetime.datetime(2025, 1, 6, 1, 0, 0)]
+        assert schedule.datetime is datetime
+
+    def test_fleet_posts_hourly(self):
+        """Test each persona posts about once an hour in virtual time."""
+        report = FleetSimulation(personas=3, days=1).run()
+
+        assert report.posts == 3 * 24
+        assert report.failed_posts == 0
+        assert 0 <= report.lag_p50 <= 60
+        assert report.virtual_hours >= 24
+        assert "3 personas" in format_report(report)
+        assert report.peak_rss_mb > 0
+
+    def test_rate_limit_collisions(self):
+        """Test posts beyond the per-account limit are rejected and counted."""
+        report = FleetSimulation(personas=2, days=1, user_daily_limit=10, openai_rpm=1).run()
+
+        assert report.posts == 2 * 10
+        assert report.user_collisions == report.failed_posts == 2 * 14
+        assert report.openai_collisions > 0
@@ -1,8 +1,9 @@
 """Twitter client tests."""
 
+import threading
 import pytest
 from unittest.mock import Mock, patch
-from src.clients.twitter import TwitterClient
+from src.clients.twitter import TwitterClient, _ThreadLocalSession, _get_shared_session
 from src.models.types import Settings
 
 
@@ -69,4 +70,51 @@ class TestTwitterClient:
         
         result = twitter.post_tweet("Test tweet")
         
-        assert result is None
\ No newline at end of file
+        assert result is None
+        
+    def test_get_recent_tweets(self):
+        """Test fetching the account's own timeline as context snippets."""
+        settings = create_test_settings()
+        twitter = TwitterClient(
+            api_key=settings.twitter_api_key,
+            api_secret=settings.twitter_api_secret,
+            access_token=settings.twitter_access_token,
+            access_token_secret=settings.twitter_access_token_secret
+        )
+        twitter._client = Mock()
+        twitter._client.get_me.return_value = Mock(data={"id": 7, "username": "bot"})
+        twitter._client.get_users_tweets.return_value = Mock(data=[{"id": 11, "text": "Hello"}])
+        
+        snippets = twitter.get_recent_tweets(since_id="10")
+        
+        assert [(s.id, s.text) for s in snippets] == [("11", "Hello")]
+        twitter._client.get_users_tweets.assert_called_once_with("7", since_id="10", max_results=10)
+        
+    def test_shared_session_is_per_thread(self):
+        """Test compact mode shares a session within a thread but not across threads."""
+        shared = _get_shared_session()
+        sessions = []
+        
+        thread = threading.Thread(target=lambda: sessions.append(shared.session))
+        thread.start()
+        thread.join()
+        
+        assert shared.session is _get_shared_session().session
+        assert sessions[0] is not shared.session
+        
+    @patch('src.clients.twitter.API')
+    def test_client_session_is_per_thread(self, mock_api):
+        """Test clients outside compact mode also use a session per thread."""
+        mock_api.return_value.verify_credentials.return_value = Mock(screen_name="bot")
+        settings = create_test_settings()
+        twitter = TwitterClient(
+            api_key=settings.twitter_api_key,
+            api_secret=settings.twitter_api_secret,
+            access_token=settings.twitter_access_token,
+            access_token_secret=settings.twitter_access_token_secret
+        )
+        
+        twitter.connect()
+        
+        assert isinstance(twitter._client.session, _ThreadLocalSession)
+        assert twitter._client.session is not _get_shared_session()